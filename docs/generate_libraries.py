@@ -114,3 +114,4 @@ if __name__ == '__main__':
     make_library('ollin.movement_models')
     make_library('ollin.estimation.occupancy')
     make_library('ollin.movement_analyzers', klass='Analyzer')
+    make_library('ollin.home_range_estimators', klass='Estimator')
@@ -1,17 +1,70 @@
-from .core.occupancy import Occupancy
-from .core.home_range import HomeRange
-from .core.sites import Site, BaseSite
-from .core.movement import Movement, MovementData
-from .core.detection import (Detection,
-                             MovementDetection,
-                             CameraConfiguration)
-
-from .movement_models.base import MovementModel
-from .movement_models import get_movement_model_list, get_movement_model
-
-from .estimation import (get_estimation_model,
-                         get_estimation_model_list)
-from .calibration import calibrate
-from .movement_analyzers import (
-    get_movement_analyzer_list,
-    get_movement_analyzer)
+"""Ollin: Animal Motion Simulator.
+
+Public names are imported lazily on first attribute access, so that
+``import ollin`` does not load scipy, numba or compile any kernel until
+something that needs them is used.
+"""
+from importlib import import_module
+import sys
+
+
+_LAZY_ATTRIBUTES = {
+    'Occupancy': 'ollin.core.occupancy',
+    'HomeRange': 'ollin.core.home_range',
+    'Site': 'ollin.core.sites',
+    'BaseSite': 'ollin.core.sites',
+    'Movement': 'ollin.core.movement',
+    'MovementData': 'ollin.core.movement',
+    'MovementArchive': 'ollin.core.archive',
+    'load_telemetry': 'ollin.core.telemetry',
+    'Detection': 'ollin.core.detection',
+    'DetectionEvents': 'ollin.core.detection',
+    'MovementDetection': 'ollin.core.detection',
+    'CameraConfiguration': 'ollin.core.detection',
+    'detect_many': 'ollin.core.detection',
+    'MovementModel': 'ollin.movement_models.base',
+    'get_movement_model_list': 'ollin.movement_models',
+    'get_movement_model': 'ollin.movement_models',
+    'get_estimation_model': 'ollin.estimation',
+    'get_estimation_model_list': 'ollin.estimation',
+    'calibrate': 'ollin.calibration',
+    'get_movement_analyzer_list': 'ollin.movement_analyzers',
+    'get_movement_analyzer': 'ollin.movement_analyzers',
+    'get_home_range_estimator_list': 'ollin.home_range_estimators',
+    'get_home_range_estimator': 'ollin.home_range_estimators',
+    'warmup': 'ollin.core.warmup',
+}
+
+_SUBPACKAGES = (
+    'core',
+    'calibration',
+    'estimation',
+    'home_range_estimators',
+    'movement_analyzers',
+    'movement_models',
+)
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _SUBPACKAGES:
+        value = import_module('{}.{}'.format(__name__, name))
+    else:
+        msg = "module '{}' has no attribute '{}'".format(__name__, name)
+        raise AttributeError(msg)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBPACKAGES))
+
+
+# Module level __getattr__ is only supported from Python 3.7 onwards.
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
@@ -39,6 +39,11 @@ BASE_CONFIG : dict
     :nums: [10, 208, 406, 604, 802, 1000]
 
         Array of number of individuals to simulate.
+    :seed: None
+
+        Seed from which a seed for every simulated scenario is derived, see
+        :py:func:`.utils.spawn_seeds`. If None, seeds will be drawn from
+        numpy's global random state.
 
 """
 import numpy as np
@@ -61,4 +66,5 @@ BASE_CONFIG = {
     'niche_sizes': np.linspace(0.2, 0.9, 4).tolist(),
     'home_ranges': np.linspace(0.1, 3, 6).tolist(),
     'nums': np.linspace(10, 1000, 6, dtype=np.int64).tolist(),
+    'seed': None,
 }
@@ -8,7 +8,9 @@ from six.moves import range
 import numpy as np
 import ollin
 
-from ..core.utils import velocity_to_home_range
+from ..core.utils import (velocity_to_home_range,
+                          get_random_state,
+                          spawn_seeds)
 from .config import BASE_CONFIG
 
 
@@ -97,6 +99,9 @@ class HomeRangeCalibrator(object):
             for velocity in velocities
             for niche_size in niche_sizes
             for k in range(num_worlds)]
+        seeds = spawn_seeds(self.config['seed'], len(arguments))
+        arguments = [
+            args + (seed,) for args, seed in zip(arguments, seeds)]
 
         logger.info('Simulating %d scenarios', len(arguments))
         pool = Pool()
@@ -253,13 +258,15 @@ class HomeRangeCalibrator(object):
 
 
 def _get_single_hr_info(args, model, range, days):
-    velocity, niche_size, num_individuals = args
-    site = ollin.Site.make_random(niche_size, range=range)
-    mov = ollin.Movement.simulate(
+    velocity, niche_size, num_individuals, seed = args
+    random_state = get_random_state(seed)
+    site = ollin.Site.make_random(
+        niche_size, range=range, seed=random_state)
+    hr = ollin.HomeRange.simulate(
         site,
         num=num_individuals,
         velocity=velocity,
         days=days,
-        movement_model=model)
-    hr = ollin.HomeRange(mov)
+        movement_model=model,
+        seed=random_state)
     return hr.home_ranges
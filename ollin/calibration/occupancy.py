@@ -8,7 +8,10 @@ from six.moves import range
 import numpy as np
 import ollin
 
-from ..core.utils import density_to_occupancy, logit
+from ..core.utils import (density_to_occupancy,
+                          logit,
+                          get_random_state,
+                          spawn_seeds)
 from .config import BASE_CONFIG
 
 
@@ -104,6 +107,9 @@ class OccupancyCalibrator(object):
             for home_range in home_ranges
             for niche_size in niche_sizes
             for k in range(num_worlds)]
+        seeds = spawn_seeds(self.config['seed'], len(arguments))
+        arguments = [
+            args + (seed,) for args, seed in zip(arguments, seeds)]
 
         n_args = len(arguments)
         n_individuals = (
@@ -407,23 +413,19 @@ def _get_single_oc_info(
         trials,
         max_individuals,
         nums):
-    home_range, niche_size = args
+    home_range, niche_size, seed = args
+    random_state = get_random_state(seed)
 
-    site = ollin.Site.make_random(niche_size, range=range_)
+    site = ollin.Site.make_random(
+        niche_size, range=range_, seed=random_state)
     mov = ollin.Movement.simulate(
         site,
         num=max_individuals,
         home_range=home_range,
         days=season,
-        movement_model=model)
-
-    n_nums = len(nums)
-    results = np.zeros([n_nums, trials])
-
-    for n, num in enumerate(nums):
-        for k in range(trials):
-            submov = mov.sample(num)
-            oc = ollin.Occupancy(submov)
-            results[n, k] = oc.occupancy
+        movement_model=model,
+        seed=random_state)
 
+    results = ollin.Occupancy.batch_from_subsamples(
+        mov, nums, trials, seed=random_state)
     return results
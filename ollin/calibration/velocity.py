@@ -8,7 +8,9 @@ from six.moves import range
 import numpy as np
 import ollin
 
-from ..core.utils import velocity_modification
+from ..core.utils import (velocity_modification,
+                          get_random_state,
+                          spawn_seeds)
 from .config import BASE_CONFIG
 
 
@@ -96,6 +98,9 @@ class VelocityCalibrator(object):
             for velocity in velocities
             for niche_size in niche_sizes
             for k in range(num_worlds)]
+        seeds = spawn_seeds(self.config['seed'], len(arguments))
+        arguments = [
+            args + (seed,) for args, seed in zip(arguments, seeds)]
 
         logger.info('Simulating %d scenarios', len(arguments))
         pool = Pool()
@@ -250,13 +255,16 @@ class VelocityCalibrator(object):
 
 
 def _get_single_velocity_info(args, model, range, days):
-    velocity, niche_size, num_individuals = args
-    site = ollin.Site.make_random(niche_size, range=range)
+    velocity, niche_size, num_individuals, seed = args
+    random_state = get_random_state(seed)
+    site = ollin.Site.make_random(
+        niche_size, range=range, seed=random_state)
     mov = ollin.Movement.simulate(
         site,
         num=num_individuals,
         velocity=velocity,
         days=days,
-        movement_model=model)
+        movement_model=model,
+        seed=random_state)
     analyzer = mov.analyze('velocity')
     return analyzer.results.mean(axis=1)
@@ -0,0 +1,272 @@
+"""Module for compressed archives of movement data.
+
+Movement data can be exported into a single compressed archive file for long
+term storage, see :py:meth:`.MovementData.export`. Positions are quantized
+to integer multiples of some small length (the quantum), and the trajectory
+array is divided into chunks of a fixed number of individuals and time steps.
+Within each chunk the first position of each individual is stored as is and
+all others as the difference to the previous step. Since individuals move
+little in a single step in comparison with the site size, differences are
+small integers that compress very well. Each chunk is compressed
+independently as a member of a zip file.
+
+Archives are opened as :py:class:`MovementArchive` objects, which only read
+and decompress the chunks needed to extract the requested individuals and
+time steps.
+
+"""
+from __future__ import division
+
+import io
+import json
+import zipfile
+
+import numpy as np
+from six.moves import xrange
+
+from .constants import GLOBAL_CONSTANTS
+from .movement import (_get_metadata,
+                       _get_site_arrays,
+                       _make_site,
+                       _from_metadata,
+                       _to_json)
+
+
+def export_archive(
+        movement,
+        path,
+        quantum=None,
+        chunk_individuals=None,
+        chunk_steps=None):
+    """Write movement data into a compressed archive.
+
+    Arguments
+    ---------
+    movement : :py:obj:`.MovementData`
+        Movement data to export.
+    path : str
+        Path of archive file.
+    quantum : float, optional
+        Size in Km of the quantization grid. Stored positions will be within
+        half a quantum of the original positions. If not given, and movement
+        is stored as quantized integers, its own scale will be used so that
+        no precision is lost. Otherwise it will be taken from the global
+        constants. See :py:const:`.GLOBAL_CONSTANTS`.
+    chunk_individuals : int, optional
+        Number of individuals per chunk. Defaults to the global constants.
+    chunk_steps : int, optional
+        Number of time steps per chunk. Defaults to the global constants.
+
+    Raises
+    ------
+    ValueError
+        If site is too large for quantized positions to be stored as 32 bit
+        integers.
+
+    """
+    if quantum is None:
+        if movement.array.dtype.kind in 'iu':
+            quantum = movement.scale
+        else:
+            quantum = GLOBAL_CONSTANTS['quantum']
+    if chunk_individuals is None:
+        chunk_individuals = GLOBAL_CONSTANTS['archive_chunk_individuals']
+    if chunk_steps is None:
+        chunk_steps = GLOBAL_CONSTANTS['archive_chunk_steps']
+
+    if movement.site.range.max() / quantum > np.iinfo(np.int32).max:
+        msg = 'Site range {} can not be stored with quantum {}'
+        raise ValueError(msg.format(movement.site.range, quantum))
+
+    metadata = _get_metadata(movement)
+    metadata['site'], site_arrays = _get_site_arrays(movement.site)
+    metadata['quantum'] = quantum
+    metadata['shape'] = [movement.num, movement.steps]
+    metadata['chunks'] = [chunk_individuals, chunk_steps]
+
+    indices = movement.indices
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            'metadata.json', json.dumps(metadata, default=_to_json))
+        for name, array in site_arrays.items():
+            _write_array(archive, name, array)
+        _write_array(archive, 'times', movement.times)
+
+        for i, start in enumerate(xrange(0, movement.num, chunk_individuals)):
+            chunk_indices = indices[start:start + chunk_individuals]
+            positions = movement.array[chunk_indices].astype(np.float64)
+            quantized = np.round(positions * (movement.scale / quantum))
+            quantized = quantized.astype(np.int64)
+
+            for j, step in enumerate(
+                    xrange(0, movement.steps, chunk_steps)):
+                chunk = quantized[:, step:step + chunk_steps, :]
+                deltas = np.diff(chunk, axis=1)
+                encoded = np.concatenate([chunk[:, :1, :], deltas], axis=1)
+                archive.writestr(
+                    _chunk_name(i, j),
+                    encoded.astype('<i4').tobytes())
+
+
+class MovementArchive(object):
+    """Compressed archive of movement data with random access.
+
+    Archives are created with :py:meth:`.MovementData.export`. Individuals
+    and time steps can be extracted with the same slicing methods as
+    :py:class:`.MovementData`, but only the compressed chunks holding them
+    are read. All extracted movement data is in float64 coordinates.
+
+    Attributes
+    ----------
+    path : str
+        Path of archive file.
+    site : :py:obj:`.Site`
+        Site at which movement took place.
+    times : array
+        Array of shape [time_steps] with times of all time steps.
+    num : int
+        Number of individuals in archive.
+    steps : int
+        Number of time steps in archive.
+    quantum : float
+        Size in Km of the quantization grid of stored positions.
+
+    """
+
+    def __init__(self, path):
+        """Open movement archive.
+
+        Arguments
+        ---------
+        path : str
+            Path of archive file.
+
+        """
+        self.path = path
+        self._archive = zipfile.ZipFile(path, 'r')
+        self.metadata = json.loads(
+            self._archive.read('metadata.json').decode('utf-8'))
+
+        self.site = _make_site(self.metadata['site'], self._read_array)
+        self.times = self._read_array('times')
+        self.num, self.steps = self.metadata['shape']
+        self.quantum = self.metadata['quantum']
+        self._chunk_individuals, self._chunk_steps = self.metadata['chunks']
+
+    def close(self):
+        """Close archive file."""
+        self._archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, individuals=None, steps=None):
+        """Read positions of some individuals at some time steps.
+
+        Arguments
+        ---------
+        individuals : slice or list or array, optional
+            Selection of individuals. Defaults to all individuals.
+        steps : slice, optional
+            Selection of time steps. Defaults to all time steps.
+
+        Returns
+        -------
+        data : array
+            Array of shape [num_individuals, time_steps, 2] with positions
+            of selected individuals at selected steps.
+
+        """
+        individuals = _as_indices(individuals, self.num)
+        steps = _as_indices(steps, self.steps)
+        data = np.empty((individuals.size, steps.size, 2), dtype=np.float64)
+
+        individual_chunks = individuals // self._chunk_individuals
+        step_chunks = steps // self._chunk_steps
+        for i in np.unique(individual_chunks):
+            rows = np.nonzero(individual_chunks == i)[0]
+            local_rows = individuals[rows] - i * self._chunk_individuals
+            for j in np.unique(step_chunks):
+                columns = np.nonzero(step_chunks == j)[0]
+                local_columns = steps[columns] - j * self._chunk_steps
+                chunk = self._read_chunk(i, j)
+                data[np.ix_(rows, columns)] = chunk[
+                    np.ix_(local_rows, local_columns)]
+        return data
+
+    def load(self):
+        """Read all movement data in archive.
+
+        Returns
+        -------
+        movement : :py:obj:`.MovementData` or :py:obj:`.Movement`
+            Movement object with all data. If a movement model was stored, a
+            :py:obj:`.Movement` object will be returned.
+
+        """
+        return self._make_movement(self.read(), self.times)
+
+    def num_slice(self, key):
+        """Extract movement of slice of individuals.
+
+        See :py:meth:`.MovementData.num_slice`.
+        """
+        if isinstance(key, (list, tuple)):
+            key = slice(*key)
+        return self._make_movement(self.read(individuals=key), self.times)
+
+    def select(self, selection):
+        """Extract movement of a subset of individuals.
+
+        See :py:meth:`.MovementData.select`.
+        """
+        return self._make_movement(
+            self.read(individuals=selection), self.times)
+
+    def time_slice(self, key):
+        """Extract movement of all individuals at a slice of time steps.
+
+        See :py:meth:`.MovementData.time_slice`.
+        """
+        if isinstance(key, (list, tuple)):
+            key = slice(*key)
+        steps = _as_indices(key, self.steps)
+        return self._make_movement(self.read(steps=steps), self.times[steps])
+
+    def _make_movement(self, data, times):
+        return _from_metadata(self.metadata, self.site, data, times)
+
+    def _read_array(self, name):
+        return np.load(io.BytesIO(self._archive.read(name + '.npy')))
+
+    def _read_chunk(self, i, j):
+        num = min(
+            self._chunk_individuals,
+            self.num - i * self._chunk_individuals)
+        steps = min(
+            self._chunk_steps,
+            self.steps - j * self._chunk_steps)
+        encoded = np.frombuffer(
+            self._archive.read(_chunk_name(i, j)), dtype='<i4')
+        encoded = encoded.reshape((num, steps, 2)).astype(np.int64)
+        return np.cumsum(encoded, axis=1) * self.quantum
+
+
+def _chunk_name(i, j):
+    return 'chunks/{}_{}'.format(i, j)
+
+
+def _write_array(archive, name, array):
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    archive.writestr(name + '.npy', buffer.getvalue())
+
+
+def _as_indices(key, size):
+    """Convert slice, integer or array selection into array of indices."""
+    if key is None:
+        return np.arange(size)
+    return np.atleast_1d(np.arange(size)[key])
@@ -21,6 +21,13 @@ GLOBAL_CONSTANTS : dict
         :cone_range: 0.01
         :cone_angle: 60
         :season: 90
+        :block_size: 100
+        :quantum: 0.001
+        :archive_chunk_individuals: 100
+        :archive_chunk_steps: 1000
+        :telemetry_chunk_size: 100000
+        :telemetry_site_points: 1000
+        :kde_method: exact
 
 MOVEMENT_PARAMETERS : dict
     This dictionary holds default values for any movement model. When extending
@@ -60,6 +67,13 @@ GLOBAL_CONSTANTS = {
     'cone_range': 0.01,
     'cone_angle': 60,
     'season': 90,
+    'block_size': 100,
+    'quantum': 0.001,
+    'archive_chunk_individuals': 100,
+    'archive_chunk_steps': 1000,
+    'telemetry_chunk_size': 100000,
+    'telemetry_site_points': 1000,
+    'kde_method': 'exact',
 }
 
 # CONSTANTS FOR MOVEMENT MODELS
@@ -8,14 +8,26 @@ through the :py:class:`Detection` class.
 Occupancy and other state variables can then be estimated with such detection
 data.
 """
+import math
+
 from six.moves import xrange
 import numpy as np
+from numba import jit, boolean, float64, int64, uint64
 from scipy.spatial import Voronoi, voronoi_plot_2d
 
 from .constants import GLOBAL_CONSTANTS
+from .utils import get_random_state
+from .rng import make_states, uniform
+from .movement import MOVEMENT_ARRAY_TYPES
 from ..estimation import get_estimation_model
 
 
+# Cameras are placed by dart throwing when at most this many are requested
+# per squared min distance of available area, well below the ~0.7 reached by
+# a maximal Poisson disk sample, see _make_random_camera_positions.
+DART_THROWING_DENSITY = 0.1
+
+
 class CameraConfiguration(object):
     """Camera configuration class holding camera positions and directions.
 
@@ -207,12 +219,16 @@ class CameraConfiguration(object):
             site,
             min_distance=None,
             cone_range=None,
-            cone_angle=None):
+            cone_angle=None,
+            only_niche=False,
+            seed=None):
         """Place cameras randomly in range.
 
         Will create a number of cameras placed at random with random
         directions. If min_distance option is passed, then camera positions
         will be chosen so that any two are not closer that min_distance.
+        Such positions are drawn from a Poisson disk sample of the site, see
+        :py:func:`_make_random_camera_positions`.
 
         Arguments
         ---------
@@ -229,23 +245,40 @@ class CameraConfiguration(object):
         cone_angle : float, optional
             Viewing angle of camera in radians. Default behaviour is as with
             cone_range.
+        only_niche : bool, optional
+            If True cameras will only be placed within the true niche of the
+            site, see :py:meth:`.BaseSite.get_true_niche`. Defaults to False.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for camera positions and directions. See
+            :py:func:`.utils.get_random_state`.
 
         Returns
         -------
         camera : :py:obj:`CameraConfiguration`
             Camera configuration object with random positions and directions.
 
+        Raises
+        ------
+        RuntimeError
+            If cameras can not be placed with the given restrictions.
+
         """
         range = site.range.astype(np.float64)
+        random_state = get_random_state(seed)
+
+        if only_niche:
+            mask = site.get_true_niche(site.niche)
+        else:
+            mask = np.ones((1, 1), dtype=np.bool_)
 
         if min_distance is None:
-            positions_x = np.random.uniform(0, range[0], size=(num))
-            positions_y = np.random.uniform(0, range[1], size=(num))
-            positions = np.stack([positions_x, positions_y], -1)
+            positions = _make_random_points_in_mask(
+                num, range, mask, random_state=random_state)
         else:
             positions = _make_random_camera_positions(
-                num, range, min_distance=min_distance)
-        angles = _make_random_directions(num)
+                num, range, min_distance=min_distance, mask=mask,
+                random_state=random_state)
+        angles = _make_random_directions(num, random_state=random_state)
         cam = cls(
             positions,
             angles,
@@ -260,7 +293,8 @@ class CameraConfiguration(object):
             distance,
             site,
             cone_range=None,
-            cone_angle=None):
+            cone_angle=None,
+            seed=None):
         """Place grid of cameras in virtual world.
 
         Place cameras in a square grid configuration in range of virtual world,
@@ -279,6 +313,8 @@ class CameraConfiguration(object):
         cone_angle : float, optional
             Viewing angle of camera in radians. Default behaviour is as with
             range.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for camera directions.
 
         Returns
         -------
@@ -300,8 +336,9 @@ class CameraConfiguration(object):
         X, Y = np.meshgrid(points_x, points_y)
         positions = np.stack((X, Y), -1) + (np.array([shift_x, shift_y]) / 2)
         positions = positions.reshape([-1, 2])
-        num = positions.size / 2
-        angles = _make_random_directions(num)
+        num = positions.shape[0]
+        angles = _make_random_directions(
+            num, random_state=get_random_state(seed))
         cam = cls(
             positions,
             angles,
@@ -311,9 +348,18 @@ class CameraConfiguration(object):
         return cam
 
 
-def _make_random_camera_positions(num, range, min_distance):
+def _make_random_camera_positions(
+        num, range, min_distance, mask=None, random_state=np.random):
     """Create and return n random points in range separated by min distance.
 
+    When few points are requested relative to the number that fit in range,
+    points are placed by dart throwing: uniform random candidates are
+    accepted if they are farther than min distance from all points accepted
+    so far, and sampling stops as soon as num points are accepted. Cost then
+    depends on num and not on the area of range. Otherwise, or if dart
+    throwing keeps failing, points are selected at random from a maximal
+    Poisson disk sample of the range, generated with Bridson's algorithm.
+
     Arguments
     ---------
     num : int
@@ -323,6 +369,11 @@ def _make_random_camera_positions(num, range, min_distance):
         square.
     min_distance : float
         Distance of minimum separation between points.
+    mask : array, optional
+        Boolean array that discretizes range. If given, points will only be
+        placed in cells where mask is True.
+    random_state : :py:obj:`numpy.random.RandomState`, optional
+        Source of randomness. Defaults to numpy's global random state.
 
     Returns
     -------
@@ -336,42 +387,211 @@ def _make_random_camera_positions(num, range, min_distance):
         restriction has to be broken.
 
     """
-    random_points_x = np.random.uniform(range[0]/10.0, size=[10, 10, 10])
-    random_points_y = np.random.uniform(range[0]/10.0, size=[10, 10, 10])
-    random_points = np.stack([random_points_x, random_points_y], -1)
-    shift_x = np.linspace(0, range[0], 10, endpoint=False)
-    shift_y = np.linspace(0, range[1], 10, endpoint=False)
-    shifts = np.stack(np.meshgrid(shift_x, shift_y), -1)
-    points = random_points + shifts[:, :, None, :]
-
-    points = points.reshape([-1, 2])
-    np.random.shuffle(points)
-
-    selection = [points[0]]
-    for i in xrange(num - 1):
-        selected = False
-        for point in points[1:]:
-            is_far = True
-            for other_point in selection:
-                distance = np.sqrt(
-                        (point[0] - other_point[0])**2 +
-                        (point[1] - other_point[1])**2)
-                if distance <= min_distance:
-                    is_far = False
-                    break
-            if is_far:
-                selected = True
-                selection.append(point)
+    if mask is None:
+        mask = np.ones((1, 1), dtype=np.bool_)
+
+    range = np.asarray(range, dtype=np.float64)
+    mask = np.asarray(mask, dtype=np.bool_)
+    min_distance = float(min_distance)
+
+    area = range[0] * range[1] * mask.mean()
+    if num <= DART_THROWING_DENSITY * area / min_distance**2:
+        points = _dart_throwing_sample(
+            num, range, min_distance, mask, random_state)
+        if points is not None:
+            return points
+
+    points = _poisson_disk_sample(
+        range,
+        min_distance,
+        mask,
+        30,
+        make_states(1, random_state))
+
+    if points.shape[0] < num:
+        raise RuntimeError("Cameras don't fit.")
+
+    selection = random_state.choice(points.shape[0], size=num, replace=False)
+    return points[selection]
+
+
+def _dart_throwing_sample(
+        num, range, radius, mask, random_state, tries=30):
+    """Place num points in mask, farther than radius apart, by dart throwing.
+
+    Accepted points are stored in a dictionary keyed by cells of side radius,
+    so only neighbouring cells need to be checked and memory grows with num.
+    Returns None if more than tries * num candidates are rejected.
+    """
+    mask_x, mask_y = mask.shape
+    points = np.zeros((num, 2))
+    cells = {}
+    num_points = 0
+    rejected = 0
+
+    while num_points < num:
+        candidates = random_state.uniform(size=[num, 2]) * range
+        for posx, posy in candidates:
+            cellx = int(posx / radius)
+            celly = int(posy / radius)
+            in_mask = mask[
+                min(int(posx * mask_x / range[0]), mask_x - 1),
+                min(int(posy * mask_y / range[1]), mask_y - 1)]
+            neighbours = [
+                other
+                for nx in xrange(cellx - 1, cellx + 2)
+                for ny in xrange(celly - 1, celly + 2)
+                for other in cells.get((nx, ny), ())]
+
+            if not in_mask or (neighbours and np.min(
+                    (points[neighbours, 0] - posx)**2 +
+                    (points[neighbours, 1] - posy)**2) <= radius**2):
+                rejected += 1
+                if rejected > tries * num:
+                    return None
+                continue
+
+            points[num_points] = posx, posy
+            cells.setdefault((cellx, celly), []).append(num_points)
+            num_points += 1
+            if num_points == num:
+                break
+
+    return points
+
+
+def _make_random_points_in_mask(num, range, mask, random_state=np.random):
+    """Create and return n uniform random points in cells where mask is True.
+
+    Raises
+    ------
+    RuntimeError
+        If mask has no True cells.
+
+    """
+    if not mask.any():
+        raise RuntimeError("Cameras don't fit.")
+
+    num_sides_x, num_sides_y = mask.shape
+    points = np.zeros([0, 2])
+    while points.shape[0] < num:
+        candidates = random_state.uniform(size=[num, 2]) * range
+        indices_x = np.minimum(
+            (candidates[:, 0] * num_sides_x / range[0]).astype(np.int64),
+            num_sides_x - 1)
+        indices_y = np.minimum(
+            (candidates[:, 1] * num_sides_y / range[1]).astype(np.int64),
+            num_sides_y - 1)
+        valid = mask[indices_x, indices_y]
+        points = np.concatenate([points, candidates[valid]], 0)
+    return points[:num]
+
+
+@jit(nopython=True, cache=True)
+def _is_free(posx, posy, points, grid, cell_size, radius, range, mask):
+    """Check if point is in range and mask and far from all other points."""
+    if not ((0 <= posx < range[0]) and (0 <= posy < range[1])):
+        return False
+
+    mask_x, mask_y = mask.shape
+    if not mask[min(int(posx * mask_x / range[0]), mask_x - 1),
+                min(int(posy * mask_y / range[1]), mask_y - 1)]:
+        return False
+
+    num_cells_x, num_cells_y = grid.shape
+    cellx = int(posx / cell_size)
+    celly = int(posy / cell_size)
+    for nx in xrange(max(cellx - 2, 0), min(cellx + 3, num_cells_x)):
+        for ny in xrange(max(celly - 2, 0), min(celly + 3, num_cells_y)):
+            other = grid[nx, ny]
+            if other == -1:
+                continue
+            distance = (
+                (posx - points[other, 0])**2 +
+                (posy - points[other, 1])**2)
+            if distance <= radius**2:
+                return False
+    return True
+
+
+@jit(
+    float64[:, :](
+        float64[:],
+        float64,
+        boolean[:, :],
+        int64,
+        uint64[:]),
+    nopython=True,
+    cache=True)
+def _poisson_disk_sample(range, radius, mask, tries, random_states):
+    """Bridson's Poisson disk sampling restricted to mask.
+
+    Returns a maximal set of points in range, with no two points within radius
+    of each other. New points are searched in the annulus around active
+    points, using a background grid with cells of side radius / sqrt(2) so
+    that each cell holds at most one point. When no active points remain, new
+    random seeds are tried to reach disconnected regions of the mask. Random
+    numbers are drawn from a single stream, see :py:mod:`.rng`.
+    """
+    cell_size = radius / math.sqrt(2)
+    num_cells_x = int(math.ceil(range[0] / cell_size))
+    num_cells_y = int(math.ceil(range[1] / cell_size))
+    grid = np.full((num_cells_x, num_cells_y), -1, dtype=np.int64)
+
+    capacity = num_cells_x * num_cells_y
+    points = np.zeros((capacity, 2))
+    active = np.zeros(capacity, dtype=np.int64)
+    num_points = 0
+    num_active = 0
+    seed_tries = 0
+
+    while True:
+        if num_active == 0:
+            if seed_tries == 10 * tries:
+                break
+            seed_tries += 1
+            posx = range[0] * uniform(random_states, 0)
+            posy = range[1] * uniform(random_states, 0)
+            if _is_free(
+                    posx, posy, points, grid, cell_size, radius, range, mask):
+                points[num_points, 0] = posx
+                points[num_points, 1] = posy
+                grid[int(posx / cell_size), int(posy / cell_size)] = num_points
+                active[num_active] = num_points
+                num_points += 1
+                num_active += 1
+            continue
+
+        index = int(num_active * uniform(random_states, 0))
+        parent = active[index]
+
+        found = False
+        for _ in xrange(tries):
+            distance = radius * math.sqrt(1 + 3 * uniform(random_states, 0))
+            angle = 2 * np.pi * uniform(random_states, 0)
+            posx = points[parent, 0] + distance * math.cos(angle)
+            posy = points[parent, 1] + distance * math.sin(angle)
+            if _is_free(
+                    posx, posy, points, grid, cell_size, radius, range, mask):
+                points[num_points, 0] = posx
+                points[num_points, 1] = posy
+                grid[int(posx / cell_size), int(posy / cell_size)] = num_points
+                active[num_active] = num_points
+                num_points += 1
+                num_active += 1
+                found = True
                 break
-        if not selected:
-            raise RuntimeError("Cameras don't fit.")
 
-    return np.array(selection)
+        if not found:
+            active[index] = active[num_active - 1]
+            num_active -= 1
 
+    return points[:num_points]
 
-def _make_random_directions(num):
+
+def _make_random_directions(num, random_state=np.random):
     """Create and return n random direction vectors."""
-    angles = np.random.uniform(0, 2*np.pi, size=[num])
+    angles = random_state.uniform(0, 2*np.pi, size=[num])
     directions = np.stack([np.cos(angles), np.sin(angles)], -1)
     return directions
 
@@ -541,6 +761,148 @@ class Detection(object):
         return ax
 
 
+class DetectionEvents(object):
+    """Sparse log of detection events.
+
+    Detections of individuals by cameras are rare, so instead of an array of
+    shape [num_individuals, time_steps, num_cams] only the list of
+    (individual, step, camera) events is stored. Events are sorted by
+    individual, step and camera, and the events of the i-th individual are
+    located, as in a CSR matrix, at::
+
+        slice(indptr[i], indptr[i + 1])
+
+    Attributes
+    ----------
+    individuals : array
+        Array of shape [num_events] with the individual of each event.
+    steps : array
+        Array of shape [num_events] with the time step of each event.
+    cameras : array
+        Array of shape [num_events] with the camera of each event.
+    indptr : array
+        Array of shape [num_individuals + 1] with the start and end of the
+        events of each individual.
+    num_individuals : int
+        Number of individuals being detected.
+    num_steps : int
+        Number of time steps of detected movement.
+    num_cams : int
+        Number of cameras.
+
+    """
+
+    def __init__(self, events, num_individuals, num_steps, num_cams):
+        """Construct detection event log.
+
+        Arguments
+        ---------
+        events : array
+            Array of shape [num_events, 3] of (individual, step, camera)
+            detection events, in any order.
+        num_individuals : int
+            Number of individuals being detected.
+        num_steps : int
+            Number of time steps of detected movement.
+        num_cams : int
+            Number of cameras.
+
+        """
+        events = np.asarray(events, dtype=np.int64).reshape([-1, 3])
+        order = np.lexsort((events[:, 2], events[:, 1], events[:, 0]))
+        events = events[order]
+
+        self.individuals = events[:, 0]
+        self.steps = events[:, 1]
+        self.cameras = events[:, 2]
+        self.num_individuals = num_individuals
+        self.num_steps = num_steps
+        self.num_cams = num_cams
+        self.indptr = np.searchsorted(
+            self.individuals, np.arange(num_individuals + 1))
+
+    @property
+    def num_events(self):
+        """Total number of detection events."""
+        return self.individuals.size
+
+    def to_grid(self):
+        """Return dense array of shape [num_individuals, steps, num_cams]."""
+        grid = np.zeros(
+            (self.num_individuals, self.num_steps, self.num_cams),
+            dtype=np.bool_)
+        grid[self.individuals, self.steps, self.cameras] = True
+        return grid
+
+    def detections(self):
+        """Return array of shape [steps, num_cams] of camera detections."""
+        detections = np.zeros(
+            (self.num_steps, self.num_cams), dtype=np.bool_)
+        detections[self.steps, self.cameras] = True
+        return detections
+
+    def camera_counts(self):
+        """Return array of shape [num_cams] of events per camera."""
+        return np.bincount(self.cameras, minlength=self.num_cams)
+
+    def capture_history(self, individual):
+        """Return detections of a single individual.
+
+        Arguments
+        ---------
+        individual : int
+            Index of individual.
+
+        Returns
+        -------
+        history : array
+            Array of shape [steps, num_cams] where::
+
+                history[k, i] = True
+
+            means that the individual was detected by the i-th camera at the
+            k-th time step.
+
+        """
+        start = self.indptr[individual]
+        stop = self.indptr[individual + 1]
+        history = np.zeros((self.num_steps, self.num_cams), dtype=np.bool_)
+        history[self.steps[start:stop], self.cameras[start:stop]] = True
+        return history
+
+    def capture_histories(self):
+        """Return capture histories of all individuals.
+
+        Returns
+        -------
+        histories : array
+            Array of shape [num_individuals, steps] where::
+
+                histories[j, k] = True
+
+            means that the j-th individual was detected by some camera at the
+            k-th time step.
+
+        """
+        histories = np.zeros(
+            (self.num_individuals, self.num_steps), dtype=np.bool_)
+        histories[self.individuals, self.steps] = True
+        return histories
+
+    def save(self, path):
+        """Save detection events into a compressed .npz file."""
+        events = np.stack([self.individuals, self.steps, self.cameras], -1)
+        shape = [self.num_individuals, self.num_steps, self.num_cams]
+        np.savez_compressed(path, events=events, shape=shape)
+
+    @classmethod
+    def load(cls, path):
+        """Load detection events saved with :py:meth:`save`."""
+        with np.load(path) as data:
+            num_individuals, num_steps, num_cams = data['shape']
+            return cls(data['events'], num_individuals, num_steps, num_cams)
+
+
 class MovementDetection(Detection):
     """Class holding detection data arising from movement data.
 
@@ -573,13 +935,16 @@ class MovementDetection(Detection):
         camera.
     movement : :py:obj:`.Movement`
         Movement data being detected.
+    events : :py:obj:`DetectionEvents`
+        Sparse log of all detection events.
     grid : array
         Array of shape [num_individuals, time_steps, num_cameras] holding all
-        detection data.
+        detection data. It is built from the detection events every time it
+        is accessed.
 
     """
 
-    def __init__(self, mov, cam):
+    def __init__(self, mov, cam, events=None):
         """Construct MovementDetection object.
 
         Arguments
@@ -588,17 +953,28 @@ class MovementDetection(Detection):
             Movement data being detected.
         cam : :py:obj:`CameraConfiguration`
             Cameras used for detection.
+        events : :py:obj:`DetectionEvents`, optional
+            Precomputed detection events of movement data by cameras. If not
+            given, they will be calculated. See :py:func:`detect_many`.
 
         """
         msg = "Camera range and movement range do not coincide"
         assert (cam.range == mov.site.range).all(), msg
 
+        if events is None:
+            events = _make_detection_data(mov, [cam])[0]
+
         self.movement = mov
-        self.grid = _make_detection_data(mov, cam)
-        detections = np.amax(self.grid, axis=0)
+        self.events = events
+        detections = self.events.detections()
 
         super(MovementDetection, self).__init__(cam, detections)
 
+    @property
+    def grid(self):
+        """Array of shape [num, steps, num_cams] of detection events."""
+        return self.events.to_grid()
+
     def plot(self, ax=None, figsize=(10, 10), include=None, **kwargs):
         """Plot camera detection data.
 
@@ -661,7 +1037,35 @@ class MovementDetection(Detection):
         return ax
 
 
-def _make_detection_data(movement, camera_config):
+def detect_many(mov, camera_configurations):
+    """Detect movement with several camera configurations at once.
+
+    Trajectories are traversed a single time, testing positions against the
+    union of all cameras with a shared spatial index. This is much faster than
+    calling :py:meth:`CameraConfiguration.detect` for each configuration when
+    comparing many camera layouts on the same simulated population.
+
+    Arguments
+    ---------
+    mov : :py:obj:`.Movement`
+        Movement data object to be detected by the camera configurations.
+    camera_configurations : list or tuple
+        List of :py:obj:`CameraConfiguration` objects.
+
+    Returns
+    -------
+    detections : list
+        List of :py:obj:`MovementDetection` objects, one per camera
+        configuration and in the same order.
+
+    """
+    events = _make_detection_data(mov, camera_configurations)
+    return [
+        MovementDetection(mov, cam, events=cam_events)
+        for cam, cam_events in zip(camera_configurations, events)]
+
+
+def _make_detection_data(movement, camera_configurations):
     """Generate and return detection data from movement and camera data.
 
     Movement data is held in the
@@ -669,47 +1073,163 @@ def _make_detection_data(movement, camera_config):
     by an array of shape [num_individuals, time_steps, 2], which contains the
     full history of movement along the simulated time.
 
-    Use movement history, camera placement and directions to calculate an array
-    of shape [num_individuals, time_steps, num_cams] where::
-
-        array[j, k, i] = 1
-
-    implies that the j-th individual was within the detection cone of the i-th
-    camera at the k-th time step.
+    Use movement history, camera placement and directions to calculate the
+    list of all detection events of each camera configuration. An event
+    (j, k, i) implies that the j-th individual was within the detection cone
+    of the i-th camera at the k-th time step.
 
     Arguments
     ---------
     movement : :py:obj:`.Movement`
         Movement of individuals to detect.
-    camera_config : :py:obj:`CameraConfiguration`
-        Camera position and directions to use for detection
+    camera_configurations : list
+        List of :py:obj:`CameraConfiguration` with camera positions and
+        directions to use for detection.
 
     Returns
     -------
-    grid : array
-        Array of shape [num_individuals, time_steps, num_cameras].
+    events : list
+        List of :py:obj:`DetectionEvents`, one for each camera configuration.
 
     """
-    camera_position = camera_config.positions
-    camera_direction = camera_config.directions
-    camera_direction = camera_direction[:, 0] + 1j * camera_direction[:, 1]
-
-    movement_data = movement.data
-    num, steps, _ = movement_data.shape
-    cone_range = camera_config.cone_range
-    cone_angle = np.pi * camera_config.cone_angle / 360.0
-
-    relative_pos = (movement_data[:, :, None, :] -
-                    camera_position[None, None, :, :])
-    relative_pos = relative_pos[:, :, :, 0] + 1j * relative_pos[:, :, :, 1]
-    norm = np.abs(relative_pos)
-    closeness = np.less(norm, cone_range)
-
-    angles = np.abs(np.angle(relative_pos / camera_direction, deg=1))
-    is_in_angle = np.less(angles, cone_angle, where=closeness)
-
-    detected = closeness * is_in_angle
-    return detected
+    positions = np.concatenate([
+        np.asarray(cam.positions, dtype=np.float64).reshape([-1, 2])
+        for cam in camera_configurations], 0)
+    directions = np.concatenate([
+        np.asarray(cam.directions, dtype=np.float64).reshape([-1, 2])
+        for cam in camera_configurations], 0)
+    cone_ranges = np.concatenate([
+        np.full(cam.num_cams, cam.cone_range, dtype=np.float64)
+        for cam in camera_configurations])
+    cone_angles = np.concatenate([
+        np.full(cam.num_cams, np.pi * cam.cone_angle / 360.0)
+        for cam in camera_configurations])
+
+    events = _detect(
+        movement.array,
+        movement.indices,
+        movement.scale,
+        positions,
+        directions,
+        cone_ranges,
+        cone_angles,
+        movement.site.range)
+
+    # Split events by camera configuration.
+    events = events[np.argsort(events[:, 2], kind='mergesort')]
+    offsets = np.cumsum(
+        [0] + [cam.num_cams for cam in camera_configurations])
+    limits = np.searchsorted(events[:, 2], offsets)
+
+    results = []
+    for k, cam in enumerate(camera_configurations):
+        cam_events = events[limits[k]:limits[k + 1]].copy()
+        cam_events[:, 2] -= offsets[k]
+        results.append(DetectionEvents(
+            cam_events,
+            movement.num,
+            movement.steps,
+            cam.num_cams))
+    return results
+
+
+@jit(
+    [int64[:, :](
+        array_type,
+        int64[:],
+        float64,
+        float64[:, :],
+        float64[:, :],
+        float64[:],
+        float64[:],
+        float64[:])
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    cache=True)
+def _detect(
+        array,
+        indices,
+        scale,
+        positions,
+        directions,
+        cone_ranges,
+        cone_angles,
+        range):
+    """Return all (individual, step, camera) detection events.
+
+    Only individuals of array at the given indices are considered, and
+    individuals in events are positions in the indices array. Coordinates in
+    Km are array values times scale. Cameras are
+    placed in a spatial hash of square cells at least as large as the largest
+    detection range, so each position is only tested against cameras in its
+    own and neighbouring cells. Cone angles are half the viewing angle, in
+    radians.
+    """
+    num = indices.size
+    steps = array.shape[1]
+    num_cams = positions.shape[0]
+
+    # Cells must not be smaller than detection ranges. Otherwise aim for a
+    # few cells per camera so that most positions test no camera at all.
+    cell_size = max(
+        cone_ranges.max(),
+        math.sqrt(range[0] * range[1] / (4 * num_cams)))
+    num_sides_x = int(math.ceil(range[0] / cell_size))
+    num_sides_y = int(math.ceil(range[1] / cell_size))
+
+    # Counting sort of cameras by cell.
+    camera_cells = np.zeros(num_cams, dtype=np.int64)
+    offsets = np.zeros(num_sides_x * num_sides_y + 1, dtype=np.int64)
+    for c in xrange(num_cams):
+        x = min(max(int(positions[c, 0] // cell_size), 0), num_sides_x - 1)
+        y = min(max(int(positions[c, 1] // cell_size), 0), num_sides_y - 1)
+        camera_cells[c] = x * num_sides_y + y
+        offsets[camera_cells[c] + 1] += 1
+    offsets = np.cumsum(offsets)
+    order = np.argsort(camera_cells, kind='mergesort')
+
+    capacity = 1024
+    events = np.zeros((capacity, 3), dtype=np.int64)
+    count = 0
+
+    for i in xrange(num):
+        index = indices[i]
+        for s in xrange(steps):
+            posx = array[index, s, 0] * scale
+            posy = array[index, s, 1] * scale
+            x = min(int(posx // cell_size), num_sides_x - 1)
+            y = min(int(posy // cell_size), num_sides_y - 1)
+
+            for nx in xrange(max(x - 1, 0), min(x + 2, num_sides_x)):
+                for ny in xrange(max(y - 1, 0), min(y + 2, num_sides_y)):
+                    cell = nx * num_sides_y + ny
+                    for k in xrange(offsets[cell], offsets[cell + 1]):
+                        c = order[k]
+                        relx = posx - positions[c, 0]
+                        rely = posy - positions[c, 1]
+                        if math.sqrt(relx**2 + rely**2) >= cone_ranges[c]:
+                            continue
+
+                        dirx = directions[c, 0]
+                        diry = directions[c, 1]
+                        angle = math.atan2(
+                            rely * dirx - relx * diry,
+                            relx * dirx + rely * diry)
+                        if abs(angle) >= cone_angles[c]:
+                            continue
+
+                        if count == capacity:
+                            capacity *= 2
+                            new_events = np.zeros(
+                                (capacity, 3), dtype=np.int64)
+                            new_events[:count] = events
+                            events = new_events
+
+                        events[count, 0] = i
+                        events[count, 1] = s
+                        events[count, 2] = c
+                        count += 1
+    return events[:count]
 
 
 def _voronoi_finite_polygons_2d(vor, radius=None):
@@ -14,32 +14,49 @@ Home range calculation follows the next pipeline:
    velocity of the simulation. See :py:func:`.home_range_resolution` to see the
    functional relationship between mean velocity and space resolution
 3. For each individual, all pixels in discretized space occupied by the
-   individual are counted, and an array with all presence-absence information
-   is calculated
+   individual are counted
 4. Each individual is assigned the total area of discretized space occupied
    along its movement
 
+Counting is done without building the presence-absence array of shape
+[num_individuals, x, y], which is only made on demand for plotting. Instead,
+the linear indices of the cells visited by each individual are sorted and
+the number of distinct values is counted, so that memory use only depends on
+the number of time steps.
+
+Home ranges of simulated movement can also be computed while movement is
+simulated, without storing trajectories. See :py:meth:`HomeRange.simulate`.
+
 """
+from __future__ import division
 
 import numpy as np
+from numba import jit, prange, float64, int64, uint64
+from six.moves import xrange
 
 from .utils import home_range_resolution
+from .movement import (
+    Movement, MOVEMENT_ARRAY_TYPES, _get_simulation_setup)
 
 
 class HomeRange(object):
     """Home Range class for storing home range values.
 
-    Movement data is processed into a grid of shape [num_individuals, x, y],
-    where x and y are the sizes of discretized space and where::
+    Movement data is processed into the number of distinct cells of
+    discretized space occupied by each individual. A grid of shape
+    [num_individuals, x, y], where x and y are the sizes of discretized space
+    and where::
 
         grid[i, x, y] = 1
 
-    means that the (x, y) pixel was occupied by the i-th individual.
+    means that the (x, y) pixel was occupied by the i-th individual, is only
+    built when the grid attribute is first accessed.
 
     Attributes
     ----------
-    movement : :py:obj:`.Movement`
-        Underlying movement data.
+    movement : :py:obj:`.Movement` or None
+        Underlying movement data. None if home ranges were computed during
+        simulation.
     grid : array
         Array of shape [num_individuals, x, y] with presence-absence
         information.
@@ -64,15 +81,185 @@ class HomeRange(object):
         """
         self.movement = movement
         self.resolution = home_range_resolution(movement.velocity)
-        self.grid = self._make_grid()
-        self.home_ranges = self.grid.sum(axis=(1, 2))
+        self._grid = None
+        self._first_visits = None
+
+        self._cell_counts = _count_cells(
+            movement.array,
+            movement.indices,
+            movement.scale,
+            movement.site.range,
+            self.resolution)
+        self.home_ranges = self._cell_counts * float(self.resolution) ** 2
         self.mean_home_range = self.home_ranges.mean()
 
-    def _make_grid(self):
+    @classmethod
+    def simulate(
+            cls,
+            site,
+            days=None,
+            num=None,
+            home_range=None,
+            velocity=None,
+            parameters=None,
+            movement_model='variable_levy',
+            block_size=None,
+            n_threads=None,
+            seed=None):
+        """Simulate movement and compute home ranges without storing it.
+
+        Movement is simulated in blocks of time steps (see
+        :py:meth:`.Movement.simulate_stream`). The cells visited by each
+        individual in every block are marked in a bitset with one bit per
+        cell of discretized space, and blocks are then discarded. Hence
+        memory use does not depend on the number of simulated days.
+
+        Resulting home ranges are the same as those of a
+        :py:obj:`HomeRange` built from :py:meth:`.Movement.simulate` with
+        the same arguments and seed, but the movement attribute will be None
+        and the grid attribute is not available.
+
+        Arguments
+        ---------
+        site : :py:obj:`.Site`
+            Site in which simulate movement.
+        days : int, optional
+            Number of simulation days. Defaults to 365.
+        num : int
+            Number of individuals to simulate.
+        home_range : float, optional
+            Home range of simulated species, used to estimate mean velocity
+            if velocity is not given.
+        velocity : float, optional
+            Mean velocity in Km/Day to use in movement model.
+        parameters : dict, optional
+            Parameters of movement model.
+        movement_model : str or :py:obj:`.movement_models.MovementModel`
+            Name of movement model in library o MovementModel instance to use
+            to generate simulated movement.
+        block_size : int, optional
+            Maximum number of time steps per block. If not given it will be
+            taken from the global constants. See :py:const:`.GLOBAL_CONSTANTS`.
+        n_threads : int, optional
+            Number of threads to use in simulation. If not given, numba's
+            default will be used.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness. See :py:func:`.utils.get_random_state`.
+
+        Returns
+        -------
+        hr : :py:obj:`HomeRange`
+            Home range of simulated individuals.
+
+        """
+        movement_model, num, velocity, _, _ = _get_simulation_setup(
+            site,
+            days=days,
+            num=num,
+            home_range=home_range,
+            velocity=velocity,
+            parameters=parameters,
+            movement_model=movement_model)
+
+        resolution = home_range_resolution(velocity)
+        num_cells = np.prod(np.ceil(site.range / resolution).astype(np.int64))
+        bitsets = np.zeros((num, (num_cells + 63) // 64), dtype=np.uint64)
+
+        stream = Movement.simulate_stream(
+            site,
+            days=days,
+            num=num,
+            velocity=velocity,
+            movement_model=movement_model,
+            block_size=block_size,
+            n_threads=n_threads,
+            seed=seed)
+
+        for block in stream:
+            _mark_cells(block.data, bitsets, site.range, resolution)
+
+        hr = cls.__new__(cls)
+        hr.movement = None
+        hr.resolution = resolution
+        hr._grid = None
+        hr._first_visits = None
+        hr.home_ranges = _count_bits(bitsets) * float(resolution) ** 2
+        hr.mean_home_range = hr.home_ranges.mean()
+        return hr
+
+    def growth_curve(self, times):
+        """Home range of every individual at several time horizons.
+
+        The home range at a time horizon is the area of the cells occupied
+        by the individual at all time steps up to the horizon. The step at
+        which each individual first visited each cell is computed once, in a
+        single pass over movement data, and stored; hence home range growth
+        can be evaluated at any number of horizons without recomputation.
+
+        Arguments
+        ---------
+        times : float or list or array
+            Time horizons, in days, in the same time units as the
+            movement times attribute.
+
+        Returns
+        -------
+        home_ranges : array
+            Array of shape [num_individuals, num_times] with the home range
+            in Km^2 of each individual up to each time horizon.
+
+        Raises
+        ------
+        ValueError
+            If home range was computed without storing movement data.
+
+        """
+        movement = self.movement
+        if movement is None:
+            msg = 'Home range growth requires stored movement data'
+            raise ValueError(msg)
+
+        offsets = np.zeros(movement.num + 1, dtype=np.int64)
+        np.cumsum(self._cell_counts, out=offsets[1:])
+        if self._first_visits is None:
+            self._first_visits = _first_visits(
+                movement.array,
+                movement.indices,
+                movement.scale,
+                movement.site.range,
+                self.resolution,
+                offsets)
+
+        # Last step included at each horizon, -1 if none is.
+        last_steps = np.searchsorted(
+            movement.times, np.atleast_1d(times), side='right') - 1
+
+        # First visits are sorted within the segment of each individual, so
+        # shifting segments apart makes the whole array sorted.
+        shifts = np.arange(movement.num) * movement.steps
+        keys = self._first_visits + np.repeat(shifts, self._cell_counts)
+        queries = shifts[:, None] + last_steps[None, :]
+        counts = np.searchsorted(keys, queries, side='right')
+        counts -= offsets[:-1, None]
+        return counts * float(self.resolution) ** 2
+
+    @property
+    def grid(self):
+        """Array of shape [num_individuals, x, y] of presence-absence."""
+        if self._grid is None:
+            self._grid = self._make_grid()
+        return self._grid
+
+    def _make_grid(self, individuals=None):
         mov_data = self.movement
-        num, steps, _ = mov_data.data.shape
+        if mov_data is None:
+            msg = 'Home range grid requires stored movement data'
+            raise ValueError(msg)
         range_ = mov_data.site.range
-        array = mov_data.data
+        if individuals is None:
+            array = mov_data.data
+        else:
+            array = mov_data.select(individuals).data
 
         grid = make_grid(array, range_, self.resolution)
         return grid
@@ -148,14 +335,14 @@ class HomeRange(object):
             if n_individual == 'all':
                 n_individual = range(self.movement.num)
             if isinstance(n_individual, (list, tuple, np.ndarray)):
-                home_range = self.grid[np.array(n_individual)]
+                home_range = self._make_grid(np.array(n_individual))
                 is_list = True
             elif n_individual == 'mean':
                 home_range = self.grid.mean(axis=0)
             else:
-                home_range = self.grid[n_individual]
+                home_range = self._make_grid([n_individual])[0]
 
-            _, sizex, sizey = self.grid.shape
+            sizex, sizey = home_range.shape[-2:]
             range_ = self.movement.site.range
             rangex, rangey = np.meshgrid(
                 np.linspace(0, range_[0], sizex),
@@ -208,12 +395,12 @@ def make_grid(array, range, resolution):
     num, steps, _ = array.shape
 
     grid = np.zeros([num, num_sides_x, num_sides_y])
-    indices = np.true_divide(array, resolution).astype(np.int)
+    indices = np.true_divide(array, resolution).astype(np.int64)
 
     nums = np.linspace(
         0, num,
         num * steps,
-        endpoint=False).astype(np.int).reshape([-1, 1])
+        endpoint=False).astype(np.int64).reshape([-1, 1])
     xcoords, ycoords = np.split(indices.reshape([-1, 2]), 2, -1)
 
     ycoords = np.minimum(ycoords, num_sides_y - 1)
@@ -221,3 +408,122 @@ def make_grid(array, range, resolution):
 
     grid[nums, xcoords, ycoords] = resolution ** 2
     return grid
+
+
+@jit(
+    [int64[:](array_type, int64, float64, float64, int64, int64)
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    cache=True)
+def _individual_cells(array, index, scale, resolution, num_sides_x,
+                      num_sides_y):
+    """Linear indices of cells visited by an individual at every step."""
+    steps = array.shape[1]
+    cells = np.empty(steps, dtype=np.int64)
+    for s in xrange(steps):
+        # Same discretization as make_grid.
+        x = int(array[index, s, 0] * scale / resolution)
+        y = int(array[index, s, 1] * scale / resolution)
+        x = min(x, num_sides_x - 1)
+        y = min(y, num_sides_y - 1)
+        cells[s] = x * num_sides_y + y
+    return cells
+
+
+@jit(
+    [int64[:](array_type, int64[:], float64, float64[:], float64)
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    parallel=True,
+    cache=True)
+def _count_cells(array, indices, scale, range, resolution):
+    num_sides_x = int(np.ceil(range[0] / resolution))
+    num_sides_y = int(np.ceil(range[1] / resolution))
+
+    num = indices.size
+    steps = array.shape[1]
+
+    counts = np.zeros(num, dtype=np.int64)
+    if steps == 0:
+        return counts
+
+    for i in prange(num):
+        cells = _individual_cells(
+            array, indices[i], scale, resolution, num_sides_x, num_sides_y)
+        cells.sort()
+
+        count = 1
+        for s in xrange(1, steps):
+            if cells[s] != cells[s - 1]:
+                count += 1
+        counts[i] = count
+    return counts
+
+
+@jit(
+    [int64[:](array_type, int64[:], float64, float64[:], float64, int64[:])
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    parallel=True,
+    cache=True)
+def _first_visits(array, indices, scale, range, resolution, offsets):
+    num_sides_x = int(np.ceil(range[0] / resolution))
+    num_sides_y = int(np.ceil(range[1] / resolution))
+
+    num = indices.size
+    first_visits = np.empty(offsets[num], dtype=np.int64)
+
+    for i in prange(num):
+        cells = _individual_cells(
+            array, indices[i], scale, resolution, num_sides_x, num_sides_y)
+
+        # Stable sort keeps steps increasing within each cell, so the first
+        # step in every run of equal cells is its first visit.
+        order = np.argsort(cells, kind='mergesort')
+        position = offsets[i]
+        for s in xrange(order.size):
+            if s == 0 or cells[order[s]] != cells[order[s - 1]]:
+                first_visits[position] = order[s]
+                position += 1
+        first_visits[offsets[i]:position].sort()
+    return first_visits
+
+
+@jit(
+    float64[:](uint64[:, :]),
+    nopython=True,
+    parallel=True,
+    cache=True)
+def _count_bits(bitsets):
+    num, words = bitsets.shape
+    counts = np.zeros(num, dtype=float64)
+    for i in prange(num):
+        count = 0
+        for w in xrange(words):
+            word = bitsets[i, w]
+            while word:
+                word &= word - uint64(1)
+                count += 1
+        counts[i] = count
+    return counts
+
+
+@jit(
+    (float64[:, :, :], uint64[:, :], float64[:], float64),
+    nopython=True,
+    parallel=True,
+    cache=True)
+def _mark_cells(array, bitsets, range, resolution):
+    num_sides_x = int(np.ceil(range[0] / resolution))
+    num_sides_y = int(np.ceil(range[1] / resolution))
+
+    num, steps, _ = array.shape
+    for i in prange(num):
+        for s in xrange(steps):
+            # Same discretization as make_grid.
+            x = int(array[i, s, 0] / resolution)
+            y = int(array[i, s, 1] / resolution)
+            x = min(x, num_sides_x - 1)
+            y = min(y, num_sides_y - 1)
+            cell = x * num_sides_y + y
+            bitsets[i, cell // 64] |= uint64(1) << uint64(cell % 64)
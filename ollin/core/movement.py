@@ -17,13 +17,21 @@ object.
 from __future__ import division
 from __future__ import print_function
 import copy
+import json
+import os
 
 import numpy as np
+from numba import types
+from scipy.stats import gaussian_kde
 
 from .constants import GLOBAL_CONSTANTS
+from .sites import BaseSite, Site
 from .utils import (occupancy_to_density,
                     home_range_to_velocity,
-                    velocity_modification)
+                    velocity_modification,
+                    num_threads,
+                    get_random_state)
+from .rng import make_states
 from ..movement_models.base import MovementModel
 from ..movement_models import get_movement_model
 from ..movement_analyzers import (
@@ -31,6 +39,19 @@ from ..movement_analyzers import (
     get_movement_analyzer_list)
 
 
+# Version of the directory layout written by MovementData.save.
+STORAGE_VERSION = 1
+
+# Storage types of movement arrays, see Movement.simulate.
+STORAGE_DTYPES = ('float64', 'float32', 'int32', 'uint16')
+
+# Numba types of movement arrays in any storage type, for kernels that read
+# movement data. Arrays are read only since they may be memory maps.
+MOVEMENT_ARRAY_TYPES = [
+    types.Array(getattr(types, dtype), 3, 'A', readonly=True)
+    for dtype in STORAGE_DTYPES]
+
+
 class MovementData(object):
     """Container for Movement data.
 
@@ -47,13 +68,36 @@ class MovementData(object):
     Apart from spatial information, times at which the time steps where taken
     are stored in another array of shape [time_steps].
 
+    Subsets of individuals (see :py:meth:`sample`, :py:meth:`select` and
+    :py:meth:`num_slice`) are views that share the underlying array and only
+    store the indices of the selected individuals. Occupancy and detection
+    calculations read the selected individuals directly from the shared
+    array; the data attribute copies them into a new array when first
+    accessed.
+
+    To save memory, positions can be stored in a smaller type than float64,
+    see :py:meth:`Movement.simulate`. Integer arrays hold positions
+    quantized to multiples of scale, so that coordinates in Km are
+    ``array * scale``. Occupancy and detection calculations read the compact
+    array directly, while the data attribute always holds float64
+    coordinates.
+
     Attributes
     ----------
     site : :py:obj:`.Site`
         Information of Site at which movement took place.
-    movement_data : array
+    data : array
         Array of shape [num_individuals, time_steps, 2] holding coordinate
         information of individual location through movement.
+    array : array
+        Underlying movement array, possibly holding individuals not in
+        selection.
+    selection : array or None
+        Indices in underlying array of the individuals in movement data. If
+        None, all individuals in array are selected.
+    scale : float
+        Size in Km of the units of the underlying array. Equals 1 unless
+        positions are quantized.
     times : array
         Array of shape [time_steps] with time at which the time steps took
         place. Units are in days.
@@ -62,7 +106,13 @@ class MovementData(object):
         See :py:class:`.Occupancy`.
 
     """
-    def __init__(self, site, movement_data, times, home_range=None):
+    def __init__(
+            self,
+            site,
+            movement_data,
+            times,
+            home_range=None,
+            scale=1.0):
         """Construct Movement Data object.
 
         Arguments
@@ -78,14 +128,53 @@ class MovementData(object):
         home_range : float, optional
             Home range value of species. Only necessary for occupancy
             calculation. See :py:class:`.Occupancy`.
+        scale : float, optional
+            Size in Km of the units of movement data. Only needed if
+            positions are quantized. Defaults to 1.
 
         """
         self.site = site
+        self.scale = scale
         self.data = movement_data
         self.times = times
         self.home_range = home_range
+
+    @property
+    def data(self):
+        """Array of shape [num_individuals, time_steps, 2] of positions."""
+        if self.selection is None and self.array.dtype == np.float64:
+            return self.array
+        if self._data is None:
+            self._data = _decode(self.array, self.selection, self.scale)
+        return self._data
+
+    @data.setter
+    def data(self, movement_data):
+        self.array = movement_data
+        self.selection = None
+        self._data = None
         self.num, self.steps, _ = movement_data.shape
 
+    @property
+    def indices(self):
+        """Indices in underlying array of all individuals in movement data."""
+        if self.selection is None:
+            return np.arange(self.num, dtype=np.int64)
+        return self.selection
+
+    def _make_view(self, array, selection=None):
+        newcopy = copy.copy(self)
+        newcopy.array = array
+        newcopy._data = None
+        if selection is None:
+            newcopy.selection = None
+            newcopy.num = array.shape[0]
+        else:
+            newcopy.selection = np.asarray(selection, dtype=np.int64)
+            newcopy.num = newcopy.selection.size
+        newcopy.steps = array.shape[1]
+        return newcopy
+
     def num_slice(self, key):
         """Extract motion from slice of individuals.
 
@@ -131,14 +220,14 @@ class MovementData(object):
                 msg = 'Num slice only accepts (int/list/tuple/slice) as'
                 msg += ' arguments. {} given.'.format(type(key))
                 raise ValueError(msg)
-        data = self.data[key, :, :]
 
-        newcopy = copy.copy(self)
-        newcopy.data = data
-        newcopy.num, newcopy.steps, _ = data.shape
-        return newcopy
+        if isinstance(key, int):
+            return self._make_view(self.array, self.indices[[key]])
+        if self.selection is None:
+            return self._make_view(self.array[key])
+        return self._make_view(self.array, self.selection[key])
 
-    def sample(self, num):
+    def sample(self, num, seed=None):
         """Extract a sample of individual movement.
 
         Select a random sample of individuals of a given size to form a new
@@ -148,6 +237,8 @@ class MovementData(object):
         ---------
         num : int
             Size of sample
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness. See :py:func:`.utils.get_random_state`.
 
         Returns
         -------
@@ -155,14 +246,11 @@ class MovementData(object):
             Movement data corresponding to sample.
 
         """
-        selection = np.random.choice(
+        random_state = get_random_state(seed)
+        selection = random_state.choice(
             np.arange(self.num),
             size=num)
-        data = self.data[selection, :, :]
-        newcopy = copy.copy(self)
-        newcopy.data = data
-        newcopy.num, newcopy.steps, _ = data.shape
-        return newcopy
+        return self._make_view(self.array, self.indices[selection])
 
     def select(self, selection):
         """Select a subset of individual movement.
@@ -183,11 +271,7 @@ class MovementData(object):
         """
         if isinstance(selection, (tuple, list)):
             selection = np.array(selection)
-        data = self.data[selection, :, :]
-        newcopy = copy.copy(self)
-        newcopy.data = data
-        newcopy.num, newcopy.steps, _ = data.shape
-        return newcopy
+        return self._make_view(self.array, self.indices[selection])
 
     def time_slice(self, key):
         """Select a slice of timesteps from movement.
@@ -229,10 +313,11 @@ class MovementData(object):
                 msg += ' arguments. {} given.'.format(type(key))
                 raise ValueError(msg)
 
-        data = self.data[:, key, :]
-        newcopy = copy.copy(self)
-        newcopy.data = data
-        newcopy.num, newcopy.steps, _ = data.shape
+        if isinstance(key, int):
+            key = slice(key, key + 1 or None)
+
+        newcopy = self._make_view(self.array[:, key, :], self.selection)
+        newcopy.times = self.times[key]
         return newcopy
 
     def plot(
@@ -317,7 +402,9 @@ class MovementData(object):
                 stride = 1
             else:
                 stride = max(int(steps / simplify), 1)
-            trajectories = self.data[:num, :steps:stride, :]
+            trajectories = _decode(
+                self.array[:, :steps:stride, :], self.indices[:num],
+                self.scale)
 
             for trajectory in trajectories:
                 xcoord, ycoord = zip(*trajectory)
@@ -357,6 +444,154 @@ class MovementData(object):
         analysis = analyzer(self)
         return analysis
 
+    def estimate_home_range(self, estimator='grid', parameters=None):
+        """Estimate home range of individuals with given estimator.
+
+        Arguments
+        ---------
+        estimator : :py:obj:`str` or :py:class:`.HomeRangeEstimator`
+            Name of estimator in library or home range estimator class to
+            estimate with. Defaults to 'grid'.
+        parameters : dict, optional
+            Parameters of estimator.
+
+        Returns
+        -------
+        estimator : :py:obj:`.HomeRangeEstimator`
+            Estimator instance with estimated home ranges.
+
+        Raises
+        ------
+        NotImplementedError:
+            When estimator name was not found in the library.
+
+        """
+        # Imported here since estimators depend on this module.
+        from ..home_range_estimators import (
+            get_home_range_estimator,
+            get_home_range_estimator_list)
+
+        if isinstance(estimator, str):
+            try:
+                estimator = get_home_range_estimator(estimator)
+            except NotImplementedError:
+                options = get_home_range_estimator_list()
+                msg = 'Estimator {} not implemented. Please select'
+                msg += ' a valid option: {}'
+                msg = msg.format(estimator, options)
+                raise NotImplementedError(msg)
+
+        return estimator(self, parameters=parameters)
+
+    def save(self, path):
+        """Store movement data in a directory of .npy files.
+
+        Movement data, times and site arrays are stored as .npy files, and
+        all other information in a metadata.json file, within the given
+        directory. Stored data can be opened with :py:meth:`open`.
+
+        If movement was simulated with a movement model from the library (see
+        :py:mod:`.movement_models`), the movement model name and
+        parameters and the velocity are also stored, and the data will be
+        opened as a :py:obj:`Movement` object.
+
+        Arguments
+        ---------
+        path : str
+            Path of directory in which to store data. Will be created if it
+            does not exist.
+
+        """
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        metadata = _get_metadata(self)
+        metadata['site'], site_arrays = _get_site_arrays(self.site)
+        metadata['scale'] = self.scale
+
+        if self.selection is None:
+            array = self.array
+        else:
+            array = self.array[self.selection]
+
+        for name, site_array in site_arrays.items():
+            np.save(os.path.join(path, name + '.npy'), site_array)
+        np.save(os.path.join(path, 'data.npy'), array)
+        np.save(os.path.join(path, 'times.npy'), self.times)
+        with open(os.path.join(path, 'metadata.json'), 'w') as jsonfile:
+            json.dump(metadata, jsonfile, default=_to_json)
+
+    def export(
+            self,
+            path,
+            quantum=None,
+            chunk_individuals=None,
+            chunk_steps=None):
+        """Export movement data into a compressed archive file.
+
+        Positions are quantized, delta encoded along time and compressed in
+        chunks of individuals and time steps, see :py:mod:`.archive`.
+        Archives can be opened with :py:class:`.MovementArchive`, which
+        allows extracting individuals and time ranges decompressing only the
+        chunks that hold them.
+
+        Arguments
+        ---------
+        path : str
+            Path of archive file.
+        quantum : float, optional
+            Size in Km of the quantization grid. See
+            :py:func:`.archive.export_archive`.
+        chunk_individuals : int, optional
+            Number of individuals per compressed chunk.
+        chunk_steps : int, optional
+            Number of time steps per compressed chunk.
+
+        """
+        from .archive import export_archive
+
+        export_archive(
+            self,
+            path,
+            quantum=quantum,
+            chunk_individuals=chunk_individuals,
+            chunk_steps=chunk_steps)
+
+    @staticmethod
+    def open(path, mmap=True):
+        """Open movement data stored with :py:meth:`save`.
+
+        Arguments
+        ---------
+        path : str
+            Path of directory holding stored data.
+        mmap : bool, optional
+            If True, movement data will be memory mapped in read only mode
+            instead of loaded into memory, so that data larger than memory
+            can be used, and shared by many processes. Slices, occupancy,
+            home range and detection calculations read directly from the
+            memory map. Defaults to True.
+
+        Returns
+        -------
+        movement : :py:obj:`MovementData` or :py:obj:`Movement`
+            Movement object with stored data. If a movement model was stored,
+            a :py:obj:`Movement` object will be returned.
+
+        """
+        with open(os.path.join(path, 'metadata.json')) as jsonfile:
+            metadata = json.load(jsonfile)
+
+        site = _make_site(
+            metadata['site'],
+            lambda name: np.load(os.path.join(path, name + '.npy')))
+        data = np.load(
+            os.path.join(path, 'data.npy'),
+            mmap_mode='r' if mmap else None)
+        times = np.load(os.path.join(path, 'times.npy'))
+        return _from_metadata(
+            metadata, site, data, times, scale=metadata.get('scale', 1.0))
+
 
 class Movement(MovementData):
     """Class for simulated movement data.
@@ -381,6 +616,9 @@ class Movement(MovementData):
         Movement model used to generate movement.
     velocity : float
         Mean velocity (in Km/Day) used to movement simulation.
+    record_every : int
+        Number of simulation steps between stored time steps. Equals 1 unless
+        movement was thinned during simulation.
 
     """
 
@@ -390,7 +628,9 @@ class Movement(MovementData):
             movement_data,
             movement_model,
             velocity,
-            home_range=None):
+            home_range=None,
+            scale=1.0,
+            record_every=1):
         """Create Movement object for simulated movement.
 
         Arguments
@@ -408,18 +648,30 @@ class Movement(MovementData):
             Home range of simulated species. Used mainly for occupancy
             calculation, or home range calibration. See
             :py:class:`.Occupancy`.
+        scale : float, optional
+            Size in Km of the units of movement data. Only needed if
+            positions are quantized. Defaults to 1.
+        record_every : int, optional
+            Number of simulation steps between stored time steps. Defaults
+            to 1.
 
         """
         self.movement_model = movement_model
         self.velocity = velocity
+        self.record_every = record_every
 
         steps = movement_data.shape[1]
         steps_per_day = movement_model.parameters['steps_per_day']
-        days = steps / steps_per_day
-        times = np.linspace(0, days, steps)
+        times = np.arange(steps) * record_every / steps_per_day
 
         super(Movement, self).__init__(
-            site, movement_data, times, home_range=home_range)
+            site, movement_data, times, home_range=home_range, scale=scale)
+
+        # Growable buffers used by extend. See _get_buffers.
+        self._buffer = None
+        self._times_buffer = None
+        self._buffer_view = None
+        self._buffer_steps = None
 
     @classmethod
     def simulate(
@@ -431,7 +683,12 @@ class Movement(MovementData):
             home_range=None,
             velocity=None,
             parameters=None,
-            movement_model='variable_levy'):
+            movement_model='variable_levy',
+            n_threads=None,
+            seed=None,
+            dtype='float64',
+            quantum=None,
+            record_every=1):
         """Make simulated movement data.
 
         Use some movement model from the model library to generate simulated
@@ -477,6 +734,32 @@ class Movement(MovementData):
         movement_model : str or :py:obj:`.movement_models.MovementModel`
             Name of movement model in library o MovementModel instance to use
             to generate simulated movement.
+        n_threads : int, optional
+            Number of threads to use in simulation. Individuals are simulated
+            in parallel, each with its own random stream, so results do not
+            depend on the number of threads. If not given, numba's default
+            will be used.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for initial positions and individual random
+            streams. Simulations with the same integer seed and arguments are
+            identical. See :py:func:`.utils.get_random_state`.
+        dtype : str, optional
+            Type in which to store positions. Options are 'float64',
+            'float32', 'int32' and 'uint16'. Integer types store positions
+            rounded to multiples of quantum. Movement is simulated in blocks
+            of time steps (see :py:meth:`simulate_stream`) that are converted
+            on the fly, so float64 data is never held in full. Defaults to
+            'float64'.
+        quantum : float, optional
+            Size in Km of the quantization grid for integer types. If not
+            given it will be taken from the global constants. See
+            :py:const:`.GLOBAL_CONSTANTS`.
+        record_every : int, optional
+            Only store positions every record_every simulation steps.
+            Movement is still simulated at steps_per_day resolution, but
+            the stored array, and any grid computed from it, is
+            record_every times smaller. Times of stored steps are kept in
+            the times attribute. Defaults to 1.
 
         Returns
         -------
@@ -487,72 +770,199 @@ class Movement(MovementData):
         ------
         ValueError
             If both num and occupancy, or velocity and home_range, are given
-            simultaneously.
+            simultaneously. If dtype is not a valid option, or site does not
+            fit in the integer type at the given quantum. If record_every is
+            less than 1.
 
         """
-        if not isinstance(movement_model, MovementModel):
-            movement_model = get_movement_model(
-                movement_model,
-                parameters=parameters)
-        parameters = movement_model.parameters
+        _check_record_every(record_every)
+        movement_model, num, velocity, sim_velocity, steps = (
+            _get_simulation_setup(
+                site,
+                days=days,
+                num=num,
+                occupancy=occupancy,
+                home_range=home_range,
+                velocity=velocity,
+                parameters=parameters,
+                movement_model=movement_model))
+
+        dtype, scale = _get_storage_type(site, dtype, quantum)
+
+        random_state = get_random_state(seed)
+        initial_positions = site.sample(num, seed=random_state)
+        random_states = make_states(num, random_state)
+
+        if dtype == np.float64:
+            with num_threads(n_threads):
+                movement_data = movement_model.generate_movement(
+                    initial_positions,
+                    site,
+                    steps,
+                    sim_velocity,
+                    random_states=random_states,
+                    record_every=record_every)
+        else:
+            recorded = (steps + record_every - 1) // record_every
+            movement_data = np.empty((num, recorded, 2), dtype=dtype)
+            stream = movement_model.generate_movement_stream(
+                initial_positions,
+                site,
+                steps,
+                sim_velocity,
+                random_states=random_states,
+                n_threads=n_threads,
+                record_every=record_every)
+
+            start = 0
+            for block in stream:
+                block_steps = block.shape[1]
+                movement_data[:, start:start + block_steps] = _encode(
+                    block, dtype, scale)
+                start += block_steps
 
-        if velocity is None:
-            if home_range is None:
-                msg = 'Arguments velocity or home_range must be provided'
-                raise ValueError(msg)
-            velocity = home_range_to_velocity(
-                home_range,
-                parameters=parameters['home_range'])
+        return cls(
+            site,
+            movement_data,
+            movement_model,
+            velocity,
+            home_range=home_range,
+            scale=scale,
+            record_every=record_every)
 
-        if num is None:
-            if occupancy is None:
-                msg = 'Arguments num or occupancy must be provided'
-                raise ValueError(msg)
-            rangex, rangey = site.range
-            if home_range is None:
-                msg = 'If num is not specified home range AND occupancy'
-                msg += ' must be provided'
-                raise ValueError(msg)
-            area = site.range[0] * site.range[1]
-            home_range_proportion = home_range / area
-            dens = occupancy_to_density(
-                occupancy,
-                home_range_proportion,
-                site.niche_size,
-                parameters=parameters['density'])
-            num = int(rangex * rangey * dens)
-
-        if days is None:
-            days = GLOBAL_CONSTANTS['days']
+    @classmethod
+    def simulate_stream(
+            cls,
+            site,
+            days=None,
+            num=None,
+            occupancy=None,
+            home_range=None,
+            velocity=None,
+            parameters=None,
+            movement_model='variable_levy',
+            block_size=None,
+            n_threads=None,
+            seed=None,
+            record_every=1):
+        """Make simulated movement data in blocks of time steps.
+
+        Same as :py:meth:`Movement.simulate` but movement is generated and
+        yielded in consecutive blocks of time steps, so that the full
+        trajectory array is never held in memory. Each block is a
+        :py:obj:`Movement` object whose times attribute holds the
+        simulation times of the block steps. Positions and random state are
+        carried across blocks, hence all blocks together form a single
+        continuous simulation.
 
-        velocity_mod = velocity_modification(
-            site.niche_size, parameters)
-        steps_per_day = parameters['steps_per_day']
-        sim_velocity = velocity * velocity_mod / steps_per_day
+        Arguments
+        ---------
+        site : :py:obj:`.Site`
+            Site in which simulate movement.
+        days : int, optional
+            Number of simulation days. Defaults to 365.
+        num : int, optional
+            Number of individuals to include in simulation. If not given,
+            occupancy argument must be provided.
+        occupancy : float, optional
+            If provided the relationship occupancy <-> density will be used to
+            estimate the number of individuals to include in simulation.
+        velocity : float, optional
+            Mean velocity in Km/Day to use in movement model. If not given,
+            home range argument must be provided.
+        home_range : float, optional
+            Home range of simulated species. If provided the relationship
+            home_range <-> mean velocity will be used to estimate the mean
+            velocity of species.
+        movement_model : str or :py:obj:`.movement_models.MovementModel`
+            Name of movement model in library o MovementModel instance to use
+            to generate simulated movement.
+        block_size : int, optional
+            Maximum number of time steps per block. If not given it will be
+            taken from the global constants. See :py:const:`.GLOBAL_CONSTANTS`.
+        n_threads : int, optional
+            Number of threads to use in simulation. If not given, numba's
+            default will be used.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness. With the same seed, the concatenation of all
+            blocks equals the movement data of :py:meth:`Movement.simulate`.
+        record_every : int, optional
+            Only store positions every record_every simulation steps. See
+            :py:meth:`Movement.simulate`.
+
+        Yields
+        ------
+        block : :py:obj:`Movement`
+            Movement instance with simulated movement data of a block of time
+            steps.
 
-        steps = int(days * steps_per_day)
+        Example
+        -------
+        To compute the mean position of individuals at every time step
+        without storing full trajectories::
+
+            means = [
+                block.data.mean(axis=0)
+                for block in Movement.simulate_stream(site, num=1000,
+                                                      velocity=1)]
+
+        """
+        _check_record_every(record_every)
+        movement_model, num, velocity, sim_velocity, steps = (
+            _get_simulation_setup(
+                site,
+                days=days,
+                num=num,
+                occupancy=occupancy,
+                home_range=home_range,
+                velocity=velocity,
+                parameters=parameters,
+                movement_model=movement_model))
 
-        initial_positions = site.sample(num)
-        movement_data = movement_model.generate_movement(
+        steps_per_day = movement_model.parameters['steps_per_day']
+        times = np.arange(0, steps, record_every) / steps_per_day
+
+        random_state = get_random_state(seed)
+        initial_positions = site.sample(num, seed=random_state)
+        random_states = make_states(num, random_state)
+        stream = movement_model.generate_movement_stream(
             initial_positions,
             site,
             steps,
-            sim_velocity)
-
-        return cls(
-            site,
-            movement_data,
-            movement_model,
-            velocity,
-            home_range=home_range)
-
-    def extend(self, days, inplace=True):
+            sim_velocity,
+            block_size=block_size,
+            random_states=random_states,
+            n_threads=n_threads,
+            record_every=record_every)
+
+        start = 0
+        for movement_data in stream:
+            block = cls(
+                site,
+                movement_data,
+                movement_model,
+                velocity,
+                home_range=home_range,
+                record_every=record_every)
+            block.times = times[start:start + block.steps]
+            start += block.steps
+            yield block
+
+    def extend(self, days, inplace=True, n_threads=None, seed=None):
         """Extend movement data with new simulated movement.
 
         Use last position as starting point to generate new simulated
         movement and append to existing. This method will use the same mean
         velocity and movement model to generate new movement.
 
+        If movement was thinned during simulation, new movement is thinned
+        in the same way and the number of new time steps is rounded down to
+        a multiple of record_every.
+
+        Movement data and times are stored in buffers with spare capacity,
+        which is doubled whenever exhausted, so that repeated extensions only
+        copy the new time steps, in amortized terms.
+
         Arguments
         ---------
         days : int
@@ -560,6 +970,11 @@ class Movement(MovementData):
         inplace : bool, optional
             If true, only Movement object attributes will be changed, otherwise
             a copy of the object will be made with the new movement data.
+        n_threads : int, optional
+            Number of threads to use in simulation. If not given, numba's
+            default will be used.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for the new movement.
 
         Returns
         -------
@@ -570,31 +985,293 @@ class Movement(MovementData):
 
         parameters = self.movement_model.parameters
         steps_per_day = parameters['steps_per_day']
-        steps = int(steps_per_day * days)
+        steps = int(steps_per_day * days) // self.record_every
+        fine_steps = steps * self.record_every
 
         velocity_mod = velocity_modification(
             self.site.niche_size, parameters)
         velocity = self.velocity * velocity_mod / steps_per_day
 
-        initial_positions = self.data[:, -1, :]
-
-        new_data = self.movement_model.generate_movement(
-            initial_positions,
-            self.site,
-            steps + 1,
-            velocity)
-        data = np.append(
-            self.data, new_data[:, 1:, :], 1)
-
-        old_steps = self.data.shape[1]
-        total_days = (old_steps + steps) / steps_per_day
-        times = np.linspace(0, total_days, old_steps + steps)
+        # Decode only the last step, which also makes a copy since movement
+        # models update initial positions in place.
+        initial_positions = np.array(_decode(
+            self.array[:, -1:, :], self.selection, self.scale)[:, 0])
+
+        random_states = make_states(self.num, get_random_state(seed))
+        with num_threads(n_threads):
+            new_data = self.movement_model.generate_movement(
+                initial_positions,
+                self.site,
+                fine_steps + 1,
+                velocity,
+                random_states=random_states,
+                record_every=self.record_every)
+
+        old_steps = self.steps
+        total_steps = old_steps + steps
+        buffer, times_buffer, buffer_steps = self._get_buffers(total_steps)
+
+        buffer[:, old_steps:total_steps, :] = _encode(
+            new_data[:, 1:, :], buffer.dtype, self.scale)
+        times_buffer[old_steps:total_steps] = (
+            self.times[-1] +
+            np.arange(1, steps + 1) * self.record_every / steps_per_day)
+        buffer_steps[0] = total_steps
 
         if inplace:
             extension = self
         else:
             extension = copy.copy(self)
 
-        extension.data = data
-        extension.times = times
+        extension.data = buffer[:, :total_steps, :]
+        extension.times = times_buffer[:total_steps]
+        extension._buffer = buffer
+        extension._times_buffer = times_buffer
+        extension._buffer_view = extension.array
+        extension._buffer_steps = buffer_steps
         return extension
+
+    def _get_buffers(self, total_steps):
+        """Get buffers with room for total_steps to extend movement into.
+
+        Current buffers are reused only if movement data is still the prefix
+        of the buffer it was last extended into, is not a view of a subset of
+        individuals, and no other object sharing the buffer has written past
+        it. Otherwise, or if capacity is not
+        enough, new buffers with at least double capacity are allocated and
+        current data is copied into them.
+        """
+        reuse = (
+            self._buffer is not None and
+            self.selection is None and
+            self.array is self._buffer_view and
+            self._buffer_steps[0] == self.steps and
+            self._buffer.shape[1] >= total_steps)
+        if reuse:
+            return self._buffer, self._times_buffer, self._buffer_steps
+
+        capacity = max(total_steps, 2 * self.steps)
+        buffer = np.empty((self.num, capacity, 2), dtype=self.array.dtype)
+        if self.selection is None:
+            buffer[:, :self.steps, :] = self.array
+        else:
+            buffer[:, :self.steps, :] = self.array[self.selection]
+        times_buffer = np.empty(capacity, dtype=np.float64)
+        times_buffer[:self.steps] = self.times
+        return buffer, times_buffer, [self.steps]
+
+
+def _get_simulation_setup(
+        site,
+        days=None,
+        num=None,
+        occupancy=None,
+        home_range=None,
+        velocity=None,
+        parameters=None,
+        movement_model='variable_levy'):
+    """Resolve simulation arguments into movement model inputs.
+
+    See :py:meth:`Movement.simulate` for a description of the arguments.
+
+    Returns
+    -------
+    movement_model : :py:obj:`.MovementModel`
+        Movement model instance to use in simulation.
+    num : int
+        Number of individuals to simulate.
+    velocity : float
+        Mean velocity (in Km/Day) of simulated species.
+    sim_velocity : float
+        Corrected velocity per step to pass to the movement model.
+    steps : int
+        Number of time steps to simulate.
+
+    Raises
+    ------
+    ValueError
+        If not enough information was given to determine number of
+        individuals or mean velocity.
+
+    """
+    if not isinstance(movement_model, MovementModel):
+        movement_model = get_movement_model(
+            movement_model,
+            parameters=parameters)
+    parameters = movement_model.parameters
+
+    if velocity is None:
+        if home_range is None:
+            msg = 'Arguments velocity or home_range must be provided'
+            raise ValueError(msg)
+        velocity = home_range_to_velocity(
+            home_range,
+            parameters=parameters['home_range'])
+
+    if num is None:
+        if occupancy is None:
+            msg = 'Arguments num or occupancy must be provided'
+            raise ValueError(msg)
+        rangex, rangey = site.range
+        if home_range is None:
+            msg = 'If num is not specified home range AND occupancy'
+            msg += ' must be provided'
+            raise ValueError(msg)
+        area = site.range[0] * site.range[1]
+        home_range_proportion = home_range / area
+        dens = occupancy_to_density(
+            occupancy,
+            home_range_proportion,
+            site.niche_size,
+            parameters=parameters['density'])
+        num = int(rangex * rangey * dens)
+
+    if days is None:
+        days = GLOBAL_CONSTANTS['days']
+
+    velocity_mod = velocity_modification(
+        site.niche_size, parameters)
+    steps_per_day = parameters['steps_per_day']
+    sim_velocity = velocity * velocity_mod / steps_per_day
+
+    steps = int(days * steps_per_day)
+
+    return movement_model, num, velocity, sim_velocity, steps
+
+
+def _get_metadata(movement):
+    """Return JSON serializable information of movement, except for site.
+
+    If movement was simulated with a movement model from the library, its
+    name, parameters and the simulation velocity are included.
+    """
+    metadata = {
+        'version': STORAGE_VERSION,
+        'home_range': movement.home_range,
+    }
+
+    movement_model = getattr(movement, 'movement_model', None)
+    module = type(movement_model).__module__
+    if module.startswith('ollin.movement_models.'):
+        metadata['movement_model'] = module.split('.')[-1]
+        metadata['parameters'] = movement_model.parameters
+        metadata['velocity'] = movement.velocity
+        metadata['record_every'] = movement.record_every
+    return metadata
+
+
+def _from_metadata(metadata, site, data, times, scale=1.0):
+    """Build movement object from data and :py:func:`_get_metadata` output."""
+    if 'movement_model' not in metadata:
+        return MovementData(
+            site,
+            data,
+            times,
+            home_range=metadata['home_range'],
+            scale=scale)
+
+    movement_model = get_movement_model(
+        metadata['movement_model'],
+        parameters=metadata['parameters'])
+    movement = Movement(
+        site,
+        data,
+        movement_model,
+        metadata['velocity'],
+        home_range=metadata['home_range'],
+        scale=scale,
+        record_every=metadata.get('record_every', 1))
+    movement.times = times
+    return movement
+
+
+def _get_site_arrays(site):
+    """Return site metadata and dictionary of site arrays to store."""
+    arrays = {
+        'site_range': site.range,
+        'site_niche': site.niche,
+    }
+
+    if isinstance(site, Site):
+        arrays['site_points'] = site.points
+        metadata = {
+            'type': 'Site',
+            'kde_bandwidth': site.kde_bandwidth,
+            'kde_method': site.kde_method,
+        }
+        return metadata, arrays
+    return {'type': 'BaseSite'}, arrays
+
+
+def _make_site(metadata, load):
+    """Restore site from metadata and stored arrays.
+
+    Arrays are read with the load function, which receives the names in
+    :py:func:`_get_site_arrays`.
+    """
+    range_ = load('site_range')
+    niche = load('site_niche')
+
+    if metadata['type'] == 'BaseSite':
+        return BaseSite(range_, niche)
+
+    # Restore niche as stored instead of estimating it again from points.
+    points = load('site_points')
+    site = Site.__new__(Site)
+    site.points = points
+    site.kde_bandwidth = metadata['kde_bandwidth']
+    site.kde_method = metadata.get('kde_method', 'exact')
+    site.kde = gaussian_kde(points.T, site.kde_bandwidth)
+    BaseSite.__init__(site, range_, niche)
+    return site
+
+
+def _to_json(obj):
+    """Convert numpy types for JSON serialization."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError('{} is not JSON serializable'.format(type(obj)))
+
+
+def _check_record_every(record_every):
+    """Check that record_every is a positive number of steps."""
+    if record_every < 1:
+        msg = 'Argument record_every must be at least 1. {} given.'
+        raise ValueError(msg.format(record_every))
+
+
+def _get_storage_type(site, dtype, quantum=None):
+    """Check storage type and return numpy dtype and scale."""
+    if str(dtype) not in STORAGE_DTYPES:
+        msg = 'Storage dtype {} not supported. Please select one of {}'
+        raise ValueError(msg.format(dtype, STORAGE_DTYPES))
+    dtype = np.dtype(dtype)
+
+    if dtype.kind == 'f':
+        return dtype, 1.0
+
+    if quantum is None:
+        quantum = GLOBAL_CONSTANTS['quantum']
+    if site.range.max() / quantum > np.iinfo(dtype).max:
+        msg = 'Site range {} does not fit in {} with quantum {}'
+        raise ValueError(msg.format(site.range, dtype, quantum))
+    return dtype, quantum
+
+
+def _encode(data, dtype, scale):
+    """Convert float64 positions into storage type."""
+    if dtype.kind == 'f':
+        return data.astype(dtype)
+    return np.round(data / scale).astype(dtype)
+
+
+def _decode(array, selection, scale):
+    """Convert positions in storage type into float64 coordinates."""
+    if selection is not None:
+        array = array[selection]
+    data = array.astype(np.float64, copy=False)
+    if scale != 1:
+        data *= scale
+    return data
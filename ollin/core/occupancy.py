@@ -63,9 +63,10 @@ from __future__ import division
 
 from six.moves import xrange
 import numpy as np
-from numba import jit, float64
+from numba import jit, float64, int64
 
-from .utils import occupancy_resolution
+from .utils import occupancy_resolution, get_random_state
+from .movement import Movement, MOVEMENT_ARRAY_TYPES
 
 
 class Occupancy(object):
@@ -83,21 +84,45 @@ class Occupancy(object):
        if some individual is in cell (i,j) at time step t.
     5. Occupancy is the average of this array.
 
+    Since the array is mostly made of zeros it is stored in compressed form,
+    as the sorted list of occupied (step, cell) pairs, see the visits
+    attribute. The dense array is only built when requested through the
+    grid attribute.
+
     Attributes
     ----------
-    movement : :py:obj:`.MovementData`
-        Movement data for which to calculate occupancy.
+    movement : :py:obj:`.MovementData` or None
+        Movement data for which to calculate occupancy. Will be None if
+        occupancy was calculated during simulation, see
+        :py:meth:`Occupancy.simulate`.
+    site : :py:obj:`.Site`
+        Site at which movement took place.
+    times : array
+        Array of shape [time_steps] with the times of the movement steps.
     steps : int
         Number of movement steps contained in movement data.
     resolution : float
         Spatial resolution (in Km) for site discretization.
-    grid : array
+    shape : tuple
+        Size [x, y] of the discretized site.
+    visits : array or None
+        Sorted array of unique linear indices::
+
+            index = (t * x + i) * y + j
+
+        one for each time step t and cell (i, j) occupied at that time step.
+        Will be None if occupancy was calculated during simulation.
+    grid : array or None
         Array of shape [time_steps, x, y] where [x, y] is the
         size of the discretized site. Holds cell occupancy at
-        each time step.
+        each time step. It is built from visits every time it is accessed.
+        Will be None if occupancy was calculated during simulation.
     cell_occupancy : array
         Array of shape [x, y] where [x, y] is the size of the
         discretized site. Holds cell occupancy.
+    occupied_cells : array
+        Array of shape [time_steps] with the number of occupied cells at each
+        time step.
     occupancy : float
         Occupancy measure.
     """
@@ -116,6 +141,8 @@ class Occupancy(object):
 
         """
         self.movement = movement
+        self.site = movement.site
+        self.times = movement.times
         self.steps = movement.steps
 
         if resolution is None:
@@ -123,10 +150,205 @@ class Occupancy(object):
         self.resolution = resolution
 
         range_ = movement.site.range
-        self.grid = _make_grid(movement.data, range_, self.resolution)
-        self.cell_occupancy = self.grid.sum(axis=0) / self.steps
+        self.shape = _get_shape(range_, self.resolution)
+        self.visits = _make_visits(
+            movement.array,
+            movement.indices,
+            movement.scale,
+            range_,
+            self.resolution)
+
+        num_cells = self.shape[0] * self.shape[1]
+        cell_visits = np.bincount(
+            self.visits % num_cells,
+            minlength=num_cells).reshape(self.shape)
+        self.cell_occupancy = cell_visits / self.steps
+        self.occupied_cells = np.bincount(
+            self.visits // num_cells,
+            minlength=self.steps)
         self.occupancy = self.cell_occupancy.mean()
 
+    @staticmethod
+    def batch_from_subsamples(
+            movement, nums, trials, resolution=None, seed=None):
+        """Calculate occupancy of many random samples of individuals.
+
+        Equivalent to::
+
+            [[Occupancy(movement.sample(num), resolution).occupancy
+              for _ in range(trials)]
+             for num in nums]
+
+        but the cell occupied by each individual at each time step is
+        calculated only once, and the occupancy of all samples is computed
+        from these cell indices without copying movement data.
+
+        Arguments
+        ---------
+        movement : :py:obj:`.MovementData`
+            Movement data from which to draw samples.
+        nums : list or tuple or array
+            Sizes of samples.
+        trials : int
+            Number of random samples to draw for each sample size.
+        resolution : float, optional
+            Resolution for space discretization. If none is given,
+            resolution will be calculated from home_range data
+            stored in the movement data.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for sample selection. See
+            :py:func:`.utils.get_random_state`.
+
+        Returns
+        -------
+        occupancies : array
+            Array of shape [len(nums), trials] with the occupancy of each
+            sample.
+
+        """
+        if resolution is None:
+            resolution = occupancy_resolution(movement.home_range)
+
+        range_ = movement.site.range
+        shape = _get_shape(range_, resolution)
+        cells = _make_cells(
+            movement.array,
+            movement.indices,
+            movement.scale,
+            range_,
+            resolution)
+
+        random_state = get_random_state(seed)
+        occupancies = np.zeros([len(nums), trials])
+        for n, num in enumerate(nums):
+            selections = random_state.randint(
+                movement.num, size=(trials, num)).astype(np.int64)
+            occupancies[n] = _sample_occupancy(
+                cells, selections, shape[0] * shape[1])
+        return occupancies
+
+    @property
+    def grid(self):
+        """Array of shape [time_steps, x, y] of cell occupancy per step."""
+        if self.visits is None:
+            return None
+
+        grid = np.zeros(self.steps * self.shape[0] * self.shape[1])
+        grid[self.visits] = 1
+        return grid.reshape((self.steps,) + self.shape)
+
+    @classmethod
+    def simulate(
+            cls,
+            site,
+            days=None,
+            num=None,
+            occupancy=None,
+            home_range=None,
+            velocity=None,
+            parameters=None,
+            movement_model='variable_levy',
+            resolution=None,
+            block_size=None,
+            n_threads=None,
+            seed=None):
+        """Simulate movement and calculate occupancy on the fly.
+
+        Movement is simulated in blocks of time steps (see
+        :py:meth:`.Movement.simulate_stream`) and each block is reduced to
+        the number of time steps each cell was visited before being discarded.
+        Hence neither the full trajectory array nor the
+        [time_steps, x, y] grid is ever held in memory. The resulting
+        occupancy object has no movement or grid information.
+
+        Arguments
+        ---------
+        site : :py:obj:`.Site`
+            Site in which simulate movement.
+        days : int, optional
+            Number of simulation days. Defaults to 365.
+        num : int, optional
+            Number of individuals to include in simulation. If not given,
+            occupancy argument must be provided.
+        occupancy : float, optional
+            If provided the relationship occupancy <-> density will be used to
+            estimate the number of individuals to include in simulation.
+        home_range : float, optional
+            Home range of simulated species. Used to estimate mean velocity if
+            not given, and to select spatial resolution.
+        velocity : float, optional
+            Mean velocity in Km/Day to use in movement model. If not given,
+            home range argument must be provided.
+        movement_model : str or :py:obj:`.movement_models.MovementModel`
+            Name of movement model in library o MovementModel instance to use
+            to generate simulated movement.
+        resolution : float, optional
+            Resolution for space discretization. If none is given,
+            resolution will be calculated from home range.
+        block_size : int, optional
+            Maximum number of time steps to simulate at once.
+        n_threads : int, optional
+            Number of threads to use in simulation. If not given, numba's
+            default will be used.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for movement simulation.
+
+        Returns
+        -------
+        occupancy : :py:obj:`Occupancy`
+            Occupancy of simulated movement.
+
+        Raises
+        ------
+        ValueError
+            If neither resolution nor home_range were given.
+
+        """
+        if resolution is None:
+            if home_range is None:
+                msg = 'Arguments resolution or home_range must be provided'
+                raise ValueError(msg)
+            resolution = occupancy_resolution(home_range)
+
+        range_ = site.range
+        shape = _get_shape(range_, resolution)
+        counts = np.zeros(shape)
+
+        stream = Movement.simulate_stream(
+            site,
+            days=days,
+            num=num,
+            occupancy=occupancy,
+            home_range=home_range,
+            velocity=velocity,
+            parameters=parameters,
+            movement_model=movement_model,
+            block_size=block_size,
+            n_threads=n_threads,
+            seed=seed)
+
+        # Start with empty arrays so that simulations with no steps give
+        # zero length results and zero occupancy.
+        times = [np.zeros(0)]
+        occupied_cells = [np.zeros(0, dtype=np.int64)]
+        for block in stream:
+            occupied_cells.append(
+                _count_visits(block.data, range_, resolution, counts))
+            times.append(block.times)
+
+        oc = cls.__new__(cls)
+        oc.movement = None
+        oc.site = site
+        oc.times = np.concatenate(times)
+        oc.steps = oc.times.size
+        oc.resolution = resolution
+        oc.shape = shape
+        oc.visits = None
+        oc.occupied_cells = np.concatenate(occupied_cells)
+        oc.cell_occupancy = counts / max(oc.steps, 1)
+        oc.occupancy = oc.cell_occupancy.mean()
+        return oc
+
     def plot(
             self,
             ax=None,
@@ -192,12 +414,15 @@ class Occupancy(object):
                 'occupancy',
                 'occupancy_contour']
 
-        self.movement.plot(include=include, ax=ax, **kwargs)
+        if self.movement is not None:
+            self.movement.plot(include=include, ax=ax, **kwargs)
+        else:
+            self.site.plot(include=include, ax=ax, **kwargs)
 
         if 'occupancy' in include:
             grid = self.cell_occupancy
 
-            range_ = self.movement.site.range
+            range_ = self.site.range
             h, w = grid.shape
             xcoord, ycoord = np.meshgrid(
                 np.linspace(0, range_[0], h),
@@ -218,6 +443,23 @@ class Occupancy(object):
 
         return ax
 
+    def timeseries(self):
+        """Calculate occupancy at all possible timespans.
+
+        Computes in a single cumulative pass the occupancy that would result
+        from restricting movement to its first n time steps, for every n.
+
+        Returns
+        -------
+        occupancies : array
+            Array of shape [time_steps] where occupancies[n - 1] is the
+            occupancy calculated from the first n time steps.
+
+        """
+        num_cells = self.shape[0] * self.shape[1]
+        steps = np.arange(1, self.steps + 1)
+        return np.cumsum(self.occupied_cells) / (steps * num_cells)
+
     def plot_occupancy_timeseries(
             self,
             ax=None,
@@ -254,8 +496,8 @@ class Occupancy(object):
         if ax is None:
             _, ax = plt.subplots(figsize=figsize)
 
-        times = self.movement.times
-        occupancies = [self.grid[:n].mean() for n in xrange(2, times.size)]
+        times = self.times
+        occupancies = self.timeseries()[1:-1]
 
         ax.plot(times[2:], occupancies, color=color, label=label)
         ax.set_xlabel('Time (Days)')
@@ -265,32 +507,129 @@ class Occupancy(object):
         return ax
 
 
+def _get_shape(range, resolution):
+    """Get size of site discretized at given resolution."""
+    num_sides_x = int(np.ceil(range[0] / resolution))
+    num_sides_y = int(np.ceil(range[1] / resolution))
+    return num_sides_x, num_sides_y
+
+
 @jit(
-    float64[:, :, :](
-        float64[:, :, :],
-        float64[:],
-        float64),
-    nopython=True)
-def _make_grid(array, range, resolution):
+    [int64[:](array_type, int64[:], float64, float64[:], float64)
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    cache=True)
+def _make_visits(array, indices, scale, range, resolution):
     num_sides_x = int(np.ceil(range[0] / resolution))
     num_sides_y = int(np.ceil(range[1] / resolution))
+    num_cells = num_sides_x * num_sides_y
 
-    num, steps, _ = array.shape
+    num = indices.size
+    steps = array.shape[1]
+
+    # Cell sizes in units of array.
+    rangex = range[0] / (num_sides_x * scale)
+    rangey = range[1] / (num_sides_y * scale)
 
-    space = np.zeros((steps, num_sides_x, num_sides_y))
+    # Step at which each cell was last visited, to store cells shared by
+    # several individuals only once per step.
+    last_visit = np.full(num_cells, -1, dtype=np.int64)
+    visits = np.zeros(num * steps, dtype=np.int64)
+
+    count = 0
+    for s in xrange(steps):
+        for i in indices:
+            x = min(int(array[i, s, 0] // rangex), num_sides_x - 1)
+            y = min(int(array[i, s, 1] // rangey), num_sides_y - 1)
+            cell = x * num_sides_y + y
+            if last_visit[cell] != s:
+                last_visit[cell] = s
+                visits[count] = s * num_cells + cell
+                count += 1
+    return np.sort(visits[:count])
+
+
+@jit(
+    [int64[:, :](array_type, int64[:], float64, float64[:], float64)
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    cache=True)
+def _make_cells(array, indices, scale, range, resolution):
+    num_sides_x = int(np.ceil(range[0] / resolution))
+    num_sides_y = int(np.ceil(range[1] / resolution))
+
+    num = indices.size
+    steps = array.shape[1]
+
+    # Cell sizes in units of array.
+    rangex = range[0] / (num_sides_x * scale)
+    rangey = range[1] / (num_sides_y * scale)
+
+    cells = np.zeros((num, steps), dtype=np.int64)
+    for i in xrange(num):
+        index = indices[i]
+        for s in xrange(steps):
+            x = min(int(array[index, s, 0] // rangex), num_sides_x - 1)
+            y = min(int(array[index, s, 1] // rangey), num_sides_y - 1)
+            cells[i, s] = x * num_sides_y + y
+    return cells
+
+
+@jit(
+    float64[:](
+        int64[:, :],
+        int64[:, :],
+        int64),
+    nopython=True,
+    cache=True)
+def _sample_occupancy(cells, selections, num_cells):
+    _, steps = cells.shape
+    trials, num = selections.shape
+
+    # Marks of last (trial, step) pair at which each cell was counted, so
+    # that the array needs no clearing between steps.
+    last_visit = np.full(num_cells, -1, dtype=np.int64)
+    occupancies = np.zeros(trials)
+
+    for t in xrange(trials):
+        count = 0
+        for s in xrange(steps):
+            mark = t * steps + s
+            for i in xrange(num):
+                cell = cells[selections[t, i], s]
+                if last_visit[cell] != mark:
+                    last_visit[cell] = mark
+                    count += 1
+        occupancies[t] = count / (steps * num_cells)
+    return occupancies
+
+
+@jit(
+    int64[:](
+        float64[:, :, :],
+        float64[:],
+        float64,
+        float64[:, :]),
+    nopython=True,
+    cache=True)
+def _count_visits(array, range, resolution, counts):
+    num_sides_x, num_sides_y = counts.shape
+    num, steps, _ = array.shape
 
-    denominator = np.zeros((2,))
-    denominator[0] = range[0] / num_sides_x
-    denominator[1] = range[1] / num_sides_y
-    indices = np.floor_divide(array, denominator).astype(np.int64)
+    rangex = range[0] / num_sides_x
+    rangey = range[1] / num_sides_y
 
-    disc_range = np.zeros((2,), dtype=np.int64)
-    disc_range[0] = num_sides_x - 1
-    disc_range[1] = num_sides_y - 1
-    indices = np.minimum(indices, disc_range)
+    # Step at which each cell was last counted, to count cells shared by
+    # several individuals only once per step.
+    last_visit = np.full((num_sides_x, num_sides_y), -1, dtype=np.int64)
+    occupied_cells = np.zeros(steps, dtype=np.int64)
 
     for s in xrange(steps):
         for i in xrange(num):
-            x, y = indices[i, s]
-            space[s, x, y] = 1
-    return space
+            x = min(int(array[i, s, 0] // rangex), num_sides_x - 1)
+            y = min(int(array[i, s, 1] // rangey), num_sides_y - 1)
+            if last_visit[x, y] != s:
+                last_visit[x, y] = s
+                counts[x, y] += 1
+                occupied_cells[s] += 1
+    return occupied_cells
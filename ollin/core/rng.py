@@ -0,0 +1,78 @@
+"""Module for reproducible random number streams in numba kernels.
+
+Movement simulation kernels draw random numbers for every individual at every
+time step. If all individuals share a single random state the resulting
+movement depends on the order in which individuals are processed, and hence on
+the number of threads used in a parallel simulation.
+
+Instead, each individual owns an independent random stream, stored as a single
+64 bit integer state. Numbers are generated with the SplitMix64 algorithm,
+which only requires adding a constant to the state and mixing the result, so
+that streams are cheap to store, to carry across simulation blocks, and to
+advance within numba kernels. Results are bit-identical regardless of the
+number of threads.
+
+"""
+import math
+
+import numpy as np
+from numba import jit, float64, int64, uint64
+
+
+GAMMA = np.uint64(0x9E3779B97F4A7C15)
+MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+MIX_2 = np.uint64(0x94D049BB133111EB)
+SHIFT_1 = np.uint64(30)
+SHIFT_2 = np.uint64(27)
+SHIFT_3 = np.uint64(31)
+SHIFT_4 = np.uint64(11)
+TO_UNIT = 1.0 / 9007199254740992.0
+
+
+def make_states(num, random_state=None):
+    """Make initial states for independent random streams.
+
+    Arguments
+    ---------
+    num : int
+        Number of random streams.
+    random_state : :py:obj:`numpy.random.RandomState`, optional
+        Source of randomness for initial states. If not given, numpy's global
+        random state will be used.
+
+    Returns
+    -------
+    states : array
+        Array of shape [num] and type uint64 holding stream states.
+
+    """
+    if random_state is None:
+        random_state = np.random
+    states = random_state.randint(
+        np.iinfo(np.int64).max,
+        size=num,
+        dtype=np.int64)
+    return states.astype(np.uint64)
+
+
+@jit(uint64(uint64[:], int64), nopython=True, cache=True)
+def next_integer(states, index):
+    """Advance the index-th stream and return a random 64 bit integer."""
+    states[index] += GAMMA
+    value = states[index]
+    value = (value ^ (value >> SHIFT_1)) * MIX_1
+    value = (value ^ (value >> SHIFT_2)) * MIX_2
+    return value ^ (value >> SHIFT_3)
+
+
+@jit(float64(uint64[:], int64), nopython=True, cache=True)
+def uniform(states, index):
+    """Return a uniform random number in [0, 1) from the index-th stream."""
+    return (next_integer(states, index) >> SHIFT_4) * TO_UNIT
+
+
+@jit(float64(uint64[:], int64), nopython=True, cache=True)
+def normal(states, index):
+    """Return a standard normal random number from the index-th stream."""
+    radius = math.sqrt(-2.0 * math.log(1.0 - uniform(states, index)))
+    return radius * math.cos(2 * math.pi * uniform(states, index))
@@ -19,6 +19,12 @@ kernel density estimation. This data could possibly arise from ecological and
 climatic variables, real telemetry data, or presence/absence data from camera
 traps studies.
 
+Evaluating the kernel density estimation at every cell of the niche array
+takes time proportional to the number of points times the number of cells.
+Niches can instead be built with a binned estimation, see
+:py:meth:`Site.make_niche_from_kde`, whose cost is nearly proportional to the
+number of cells.
+
 """
 from __future__ import division
 
@@ -28,6 +34,7 @@ from six.moves import xrange
 from scipy.stats import gaussian_kde
 
 from .constants import GLOBAL_CONSTANTS
+from .utils import get_random_state
 
 
 class BaseSite(object):
@@ -190,7 +197,7 @@ class BaseSite(object):
         return ax
 
     @abstractmethod
-    def sample(self, num):
+    def sample(self, num, seed=None):
         """Sample n random points from site."""
         pass
 
@@ -214,6 +221,9 @@ class Site(BaseSite):
         Bandwidth used in the gaussian kernel density estimation.
     kde : :py:obj:`scipy.stats.gaussian_kde`
         Density estimation object.
+    kde_method : str
+        Method used to evaluate the density estimation on the niche array,
+        either 'exact' or 'fast'. See :py:meth:`make_niche_from_kde`.
     range : array
         Array of shape [2], specifying the dimensions of site (in Km).
     niche : array
@@ -232,7 +242,8 @@ class Site(BaseSite):
             points,
             resolution=0.1,
             kde_bandwidth=0.3,
-            max_niche_value=1):
+            max_niche_value=1,
+            kde_method=None):
         """Construct site object.
 
         Arguments
@@ -254,38 +265,112 @@ class Site(BaseSite):
         max_niche_value : float, optional
             After niche construction, niche array will be scaled so that its
             maximum value is this.
+        kde_method : str, optional
+            Method of niche construction, either 'exact' or 'fast'. See
+            :py:meth:`make_niche_from_kde`. If not given it will be taken
+            from the global constants. See :py:const:`.GLOBAL_CONSTANTS`.
 
         """
+        if kde_method is None:
+            kde_method = GLOBAL_CONSTANTS['kde_method']
+
         self.points = points
         self.kde_bandwidth = kde_bandwidth
+        self.kde_method = kde_method
 
-        niche, kde = self.make_niche(points, range, kde_bandwidth, resolution)
+        niche, kde = self.make_niche(
+            points, range, kde_bandwidth, resolution, method=kde_method)
         self.kde = kde
 
         niche = max_niche_value * niche / niche.max()
         super(Site, self).__init__(range, niche)
 
-    def sample(self, num):
-        """Use kernel density estimation to sample random points form site."""
-        points = self.kde.resample(num).T
+    def sample(self, num, seed=None):
+        """Use kernel density estimation to sample random points form site.
+
+        Arguments
+        ---------
+        num : int
+            Number of points to sample.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness. See :py:func:`.utils.get_random_state`.
+
+        Returns
+        -------
+        points : array
+            Array of shape [num, 2] with coordinates of sampled points.
+
+        """
+        random_state = get_random_state(seed)
+
+        # Same as gaussian_kde.resample, which can not be given a random
+        # state in older scipy versions.
+        dimension, num_points = self.kde.dataset.shape
+        noise = random_state.multivariate_normal(
+            np.zeros(dimension), self.kde.covariance, size=num)
+        indices = random_state.randint(0, num_points, size=num)
+        points = self.kde.dataset[:, indices].T + noise
         points = np.maximum(
             np.minimum(points, self.range),
             [0, 0])
         return points
 
     @staticmethod
-    def make_niche(points, range, kde_bandwidth, resolution=1.0):
+    def make_niche(points, range, kde_bandwidth, resolution=1.0,
+                   method='exact'):
         """Make niche array from points."""
         kde = gaussian_kde(points.T, kde_bandwidth)
-        niche = Site.make_niche_from_kde(kde, range, resolution=resolution)
+        niche = Site.make_niche_from_kde(
+            kde, range, resolution=resolution, method=method)
         return niche, kde
 
     @staticmethod
-    def make_niche_from_kde(kde, range, resolution=1.0):
-        """Make niche array from kernel density estimation."""
+    def make_niche_from_kde(kde, range, resolution=1.0, method='exact'):
+        """Make niche array from kernel density estimation.
+
+        The niche array holds the density at the center of each cell. With
+        the 'exact' method the density estimation is evaluated at every cell
+        center, which takes time proportional to the number of points times
+        the number of cells.
+
+        With the 'fast' method points are linearly binned onto the grid of
+        cell centers, extended to hold all points, and the resulting
+        histogram is convolved, through the FFT, with the gaussian kernel
+        sampled at cell offsets. Time is then nearly proportional to the
+        number of cells, and values differ from the exact ones only by the
+        small error of moving points to neighbouring cell centers.
+
+        Arguments
+        ---------
+        kde : :py:obj:`scipy.stats.gaussian_kde`
+            Kernel density estimation.
+        range : array
+            Array of shape [2] with dimensions of site in Km.
+        resolution : float, optional
+            Spatial resolution of niche array, in Km.
+        method : str, optional
+            Either 'exact' or 'fast'. Defaults to 'exact'.
+
+        Returns
+        -------
+        niche : array
+            Array of shape [num_sides_x, num_sides_y] with density values.
+
+        Raises
+        ------
+        ValueError
+            If method is not a valid option.
+
+        """
         num_sides_x = int(np.ceil(range[0] / float(resolution)))
         num_sides_y = int(np.ceil(range[1] / float(resolution)))
 
+        if method == 'fast':
+            return _binned_density(kde, range, num_sides_x, num_sides_y)
+        elif method != 'exact':
+            msg = 'KDE method {} is not one of exact or fast'.format(method)
+            raise ValueError(msg)
+
         shift_x = range[0] / (num_sides_x * 2)
         shift_y = range[1] / (num_sides_y * 2)
 
@@ -369,7 +454,9 @@ class Site(BaseSite):
             max_clusters=None,
             min_cluster_points=None,
             max_cluster_points=None,
-            max_niche_value=1):
+            max_niche_value=1,
+            seed=None,
+            kde_method=None):
         """Make random site.
 
         Process for random site creation follows the next steps:
@@ -414,8 +501,17 @@ class Site(BaseSite):
         max_niche_value : float, optional
             Number in [0, 1] range. Final niche value will have this number as
             a maximum value.
+        seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+            Source of randomness for cluster points. See
+            :py:func:`.utils.get_random_state`.
+        kde_method : str, optional
+            Method of niche construction, either 'exact' or 'fast', also used
+            when selecting the bandwidth. See :py:meth:`make_niche_from_kde`.
+            If none is given it will be taken from the global constants.
 
         """
+        if kde_method is None:
+            kde_method = GLOBAL_CONSTANTS['kde_method']
         if resolution is None:
             resolution = GLOBAL_CONSTANTS['resolution']
         if range is None:
@@ -438,32 +534,34 @@ class Site(BaseSite):
 
         points = _make_random_points(
             range, min_clusters, max_clusters, min_cluster_points,
-            max_cluster_points)
+            max_cluster_points, random_state=get_random_state(seed))
 
-        bandwidth = _select_bandwidth(range, points, niche_size, resolution)
+        bandwidth = _select_bandwidth(
+            range, points, niche_size, resolution, method=kde_method)
         site = cls(
             range,
             points,
             resolution=resolution,
             kde_bandwidth=bandwidth,
-            max_niche_value=max_niche_value)
+            max_niche_value=max_niche_value,
+            kde_method=kde_method)
         return site
 
 
 def _make_random_points(range, min_clusters, max_clusters, min_cluster_points,
-                        max_cluster_points):
-    n_clusters = np.random.randint(min_clusters, max_clusters)
+                        max_cluster_points, random_state=np.random):
+    n_clusters = random_state.randint(min_clusters, max_clusters)
 
-    cluster_centers_x = np.random.uniform(0, range[0], size=[n_clusters])
-    cluster_centers_y = np.random.uniform(0, range[1], size=[n_clusters])
+    cluster_centers_x = random_state.uniform(0, range[0], size=[n_clusters])
+    cluster_centers_y = random_state.uniform(0, range[1], size=[n_clusters])
     cluster_centers = np.stack([cluster_centers_x, cluster_centers_y], -1)
 
     points = []
     for k in xrange(n_clusters):
-        n_neighbors = np.random.randint(
+        n_neighbors = random_state.randint(
             min_cluster_points, max_cluster_points)
-        centered_points = np.random.normal(size=[n_neighbors, 2])
-        variances = np.random.normal(size=[2, 2])
+        centered_points = random_state.normal(size=[n_neighbors, 2])
+        variances = random_state.normal(size=[2, 2])
         sheared_points = np.tensordot(
             centered_points, variances, (1, 1))
         shifted_points = sheared_points + cluster_centers[k]
@@ -473,7 +571,7 @@ def _make_random_points(range, min_clusters, max_clusters, min_cluster_points,
     return points
 
 
-def _select_bandwidth(range, points, niche_size, resolution):
+def _select_bandwidth(range, points, niche_size, resolution, method='exact'):
     max_iters = GLOBAL_CONSTANTS['max_iters']
     epsilon = GLOBAL_CONSTANTS['bandwidth_epsilon']
 
@@ -486,7 +584,8 @@ def _select_bandwidth(range, points, niche_size, resolution):
 
     counter = 0
     while True:
-        niche = Site.make_niche_from_kde(kde, range, resolution=resolution)
+        niche = Site.make_niche_from_kde(
+            kde, range, resolution=resolution, method=method)
         niche = niche / niche.max()
         calculated_niche = Site.get_niche_size(niche)
 
@@ -509,3 +608,62 @@ def _select_bandwidth(range, points, niche_size, resolution):
             break
 
     return (min_bw + max_bw) / 2
+
+
+def _binned_density(kde, range, num_sides_x, num_sides_y):
+    """Evaluate kernel density estimation at cell centers through the FFT."""
+    # Imported here so that importing sites only loads scipy.stats.
+    from scipy.signal import fftconvolve
+
+    sides = np.array([num_sides_x, num_sides_y])
+    cell_size = range / sides
+
+    num_points = kde.dataset.shape[1]
+    weights = getattr(kde, 'weights', None)
+    if weights is None:
+        weights = np.full(num_points, 1 / num_points)
+
+    # Coordinates of points in units of cells, with cell centers at
+    # integer values. The grid is extended so that it holds all points.
+    coords = kde.dataset.T / cell_size - 0.5
+    lower = np.minimum(np.floor(coords.min(axis=0)), 0).astype(np.int64)
+    upper = np.maximum(
+        np.floor(coords.max(axis=0)).astype(np.int64) + 1,
+        sides - 1)
+    shape = upper - lower + 1
+
+    # Linear binning: each point is split among the four nearest cell
+    # centers, with weights proportional to proximity.
+    base = np.floor(coords).astype(np.int64)
+    fractions = coords - base
+    base -= lower
+    histogram = np.zeros(shape[0] * shape[1])
+    for dx in (0, 1):
+        for dy in (0, 1):
+            share = (
+                np.abs(1 - dx - fractions[:, 0]) *
+                np.abs(1 - dy - fractions[:, 1]))
+            histogram += np.bincount(
+                (base[:, 0] + dx) * shape[1] + base[:, 1] + dy,
+                weights=weights * share,
+                minlength=histogram.size)
+    histogram = histogram.reshape(shape)
+
+    # Kernel sampled at cell offsets, up to four standard deviations or
+    # the size of the extended grid, beyond which no point can reach.
+    deviations = np.sqrt(np.diag(kde.covariance))
+    radius = np.minimum(np.ceil(4 * deviations / cell_size), shape)
+    radius = radius.astype(np.int64)
+    offset_x = np.arange(-radius[0], radius[0] + 1) * cell_size[0]
+    offset_y = np.arange(-radius[1], radius[1] + 1) * cell_size[1]
+    offsets = np.stack(np.meshgrid(offset_x, offset_y, indexing='ij'), -1)
+    exponent = np.einsum('...i,ij,...j->...', offsets, kde.inv_cov, offsets)
+    normalization = 2 * np.pi * np.sqrt(np.linalg.det(kde.covariance))
+    kernel = np.exp(-exponent / 2) / normalization
+
+    density = fftconvolve(histogram, kernel, mode='full')
+    start = radius - lower
+    density = density[
+        start[0]:start[0] + num_sides_x,
+        start[1]:start[1] + num_sides_y]
+    return np.maximum(density, 0)
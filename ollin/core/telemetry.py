@@ -0,0 +1,239 @@
+"""Module for loading real telemetry data into movement data.
+
+Telemetry data usually comes as a table of fixes, one row per recorded
+position, with columns holding an identifier of the individual, the time at
+which the fix was taken and the coordinates of the fix. Fixes of different
+individuals are taken at different and irregular times, while
+:py:class:`.MovementData` requires the positions of all individuals at the
+same time steps.
+
+Telemetry can be read from CSV files or from numpy structured arrays with
+:py:func:`load_telemetry`. CSV files are read in chunks of rows which are
+converted into compact numeric arrays, so that memory use is proportional to
+the number of fixes and not to the size of the text. Fixes are then grouped
+by individual and linearly interpolated onto a common time grid, and
+coordinates are translated into site range.
+
+"""
+from __future__ import division
+
+import csv
+from itertools import islice
+
+import numpy as np
+from six.moves import xrange
+
+from .constants import GLOBAL_CONSTANTS
+from .movement import MovementData
+from .sites import Site
+
+
+FIELDS = ('individual', 'time', 'x', 'y')
+SECONDS_PER_DAY = 86400.0
+
+
+def load_telemetry(
+        source,
+        site=None,
+        time_step=None,
+        fields=FIELDS,
+        scale=1.0,
+        origin=None,
+        chunk_size=None,
+        delimiter=','):
+    """Load telemetry fixes into a movement data object.
+
+    Fixes of each individual are sorted by time and linearly interpolated at
+    the times of a regular grid that starts at the first fix of all the data
+    and ends at the last. Before its first fix and after its last fix an
+    individual is assumed to stay at the first or last recorded position.
+    Times in the resulting movement data are in days since the first fix.
+
+    Coordinates are multiplied by scale to convert them into Km, and then
+    translated so that origin is mapped to the lower left corner of site.
+    Positions that fall outside of site range are moved to the nearest
+    point in range.
+
+    Arguments
+    ---------
+    source : str or array
+        Path to a CSV file with a header row, or numpy structured array
+        with one record per fix.
+    site : :py:obj:`.BaseSite`, optional
+        Site at which movement took place. If not given, a
+        :py:obj:`.Site` will be built from the recorded positions, with
+        range equal to the extent of the data.
+    time_step : float, optional
+        Time between steps of the resulting movement data, in days. If not
+        given, the median time between consecutive fixes of the same
+        individual will be used.
+    fields : tuple, optional
+        Names of the columns (or record fields) holding the individual
+        identifier, the time, and the x and y coordinates of each fix, in
+        that order. Times can be numbers, in days, or ISO 8601 date strings.
+    scale : float, optional
+        Size in Km of coordinate units. For instance, use 0.001 for
+        coordinates in meters. Defaults to 1.
+    origin : tuple or list or array, optional
+        Coordinates, in Km, that correspond to the lower left corner of
+        site. If not given, the minimum coordinates of all fixes will be
+        used.
+    chunk_size : int, optional
+        Number of CSV rows to read at a time. If not given, it will be
+        taken from the global constants. See
+        :py:const:`.GLOBAL_CONSTANTS`.
+    delimiter : str, optional
+        Delimiter of CSV file.
+
+    Returns
+    -------
+    movement : :py:obj:`.MovementData`
+        Movement data with interpolated positions of all individuals.
+
+    Raises
+    ------
+    ValueError
+        If there are no fixes or a field is missing.
+
+    """
+    if isinstance(source, np.ndarray):
+        individuals, times, positions = _read_array(source, fields)
+    else:
+        if chunk_size is None:
+            chunk_size = GLOBAL_CONSTANTS['telemetry_chunk_size']
+        individuals, times, positions = _read_csv(
+            source, fields, chunk_size, delimiter)
+
+    if times.size == 0:
+        raise ValueError('No telemetry fixes found')
+
+    positions *= scale
+    if origin is None:
+        origin = positions.min(axis=0)
+    positions -= np.asarray(origin, dtype=np.float64)
+
+    order = np.lexsort((times, individuals))
+    individuals = individuals[order]
+    times = times[order]
+    positions = positions[order]
+    bounds = np.searchsorted(
+        individuals, np.arange(individuals.max() + 2))
+
+    if time_step is None:
+        time_step = _median_time_step(individuals, times)
+    start = times.min()
+    num_steps = int(np.floor((times.max() - start) / time_step)) + 1
+    grid = start + time_step * np.arange(num_steps)
+
+    if site is None:
+        site = _make_site(positions)
+
+    data = np.empty([bounds.size - 1, num_steps, 2], dtype=np.float64)
+    for index in xrange(bounds.size - 1):
+        lower, upper = bounds[index], bounds[index + 1]
+        fix_times = times[lower:upper]
+        for coordinate in xrange(2):
+            data[index, :, coordinate] = np.interp(
+                grid, fix_times, positions[lower:upper, coordinate])
+
+    np.clip(data, 0, site.range, out=data)
+    return MovementData(site, data, grid - start)
+
+
+def _read_array(records, fields):
+    names = records.dtype.names or ()
+    for field in fields:
+        if field not in names:
+            msg = 'Field {} not in telemetry records'.format(field)
+            raise ValueError(msg)
+
+    individual_field, time_field, x_field, y_field = fields
+    _, individuals = np.unique(records[individual_field], return_inverse=True)
+    times = _parse_times(records[time_field])
+    positions = np.stack([
+        np.asarray(records[x_field], dtype=np.float64),
+        np.asarray(records[y_field], dtype=np.float64)], -1)
+    return individuals.astype(np.int64), times, positions
+
+
+def _read_csv(path, fields, chunk_size, delimiter):
+    codes = {}
+    individuals = []
+    times = []
+    positions = []
+
+    with open(path, 'r') as csv_file:
+        reader = csv.reader(csv_file, delimiter=delimiter)
+        header = [name.strip() for name in next(reader)]
+        for field in fields:
+            if field not in header:
+                msg = 'Column {} not in telemetry file {}'.format(field, path)
+                raise ValueError(msg)
+        columns = [header.index(field) for field in fields]
+
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                break
+
+            chunk = [
+                [row[column].strip() for row in rows if row]
+                for column in columns]
+            names, inverse = np.unique(chunk[0], return_inverse=True)
+            for name in names:
+                codes.setdefault(name, len(codes))
+            chunk_codes = np.array(
+                [codes[name] for name in names], dtype=np.int64)
+
+            individuals.append(chunk_codes[inverse])
+            times.append(_parse_times(chunk[1]))
+            positions.append(np.stack([
+                np.array(chunk[2], dtype=np.float64),
+                np.array(chunk[3], dtype=np.float64)], -1))
+
+    if not individuals:
+        return (
+            np.zeros([0], dtype=np.int64),
+            np.zeros([0]),
+            np.zeros([0, 2]))
+
+    # Number individuals in sorted order of identifiers, as is done for
+    # structured arrays.
+    ranks = np.empty(len(codes), dtype=np.int64)
+    ranks[[codes[name] for name in sorted(codes)]] = np.arange(len(codes))
+    individuals = ranks[np.concatenate(individuals)]
+    return individuals, np.concatenate(times), np.concatenate(positions)
+
+
+def _parse_times(values):
+    """Convert times in days or ISO 8601 date strings into days."""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iuf':
+        return values.astype(np.float64)
+    if values.dtype.kind == 'M':
+        seconds = values.astype('datetime64[s]').astype(np.int64)
+        return seconds / SECONDS_PER_DAY
+
+    try:
+        return values.astype(np.float64)
+    except ValueError:
+        seconds = values.astype('datetime64[s]').astype(np.int64)
+        return seconds / SECONDS_PER_DAY
+
+
+def _median_time_step(individuals, times):
+    same_individual = individuals[1:] == individuals[:-1]
+    intervals = np.diff(times)[same_individual]
+    intervals = intervals[intervals > 0]
+    if intervals.size == 0:
+        return 1.0
+    return np.median(intervals)
+
+
+def _make_site(positions):
+    resolution = GLOBAL_CONSTANTS['resolution']
+    site_range = np.maximum(positions.max(axis=0), resolution)
+
+    num_points = GLOBAL_CONSTANTS['telemetry_site_points']
+    step = max(1, positions.shape[0] // num_points)
+    return Site(site_range, positions[::step], resolution=resolution)
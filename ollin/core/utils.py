@@ -1,5 +1,6 @@
 """Helper functions."""
 from __future__ import division
+from contextlib import contextmanager
 
 import numpy as np
 
@@ -307,3 +308,83 @@ def velocity_modification(niche_size, parameters):
     alpha = parameters['velocity']['alpha']
     beta = parameters['velocity']['beta']
     return beta + alpha * niche_size
+
+
+@contextmanager
+def num_threads(threads):
+    """Set number of threads used by parallel numba kernels within context.
+
+    Movement models run individuals in parallel. Since every individual has
+    its own random stream (see :py:mod:`.rng`) results do not depend on the
+    number of threads.
+
+    Arguments
+    ---------
+    threads : int or None
+        Number of threads. It will be capped to the number of threads
+        available to numba. If None, numba's current setting is left
+        untouched. Requires numba >= 0.49, otherwise the number of threads
+        can only be set through the NUMBA_NUM_THREADS environment variable.
+
+    """
+    import numba
+
+    if threads is None or not hasattr(numba, 'set_num_threads'):
+        yield
+        return
+
+    previous = numba.get_num_threads()
+    numba.set_num_threads(
+        max(1, min(threads, numba.config.NUMBA_NUM_THREADS)))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
+def get_random_state(seed=None):
+    """Get numpy random state from seed.
+
+    Arguments
+    ---------
+    seed : None or int or :py:obj:`numpy.random.RandomState`, optional
+        If None, numpy's global random state will be returned. If int, a new
+        random state seeded with it will be created. Random state objects are
+        returned unchanged, so that they can be passed along to share a single
+        stream of random numbers.
+
+    Returns
+    -------
+    random_state : :py:obj:`numpy.random.RandomState`
+
+    """
+    if seed is None:
+        return np.random.mtrand._rand
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    return np.random.RandomState(seed)
+
+
+def spawn_seeds(seed, num):
+    """Make deterministic seeds for independent child tasks.
+
+    Child seeds are drawn from the parent's random stream. Hence the same
+    parent seed always produces the same child seeds, and any single child
+    task can be reproduced in isolation from its seed.
+
+    Arguments
+    ---------
+    seed : None or int or :py:obj:`numpy.random.RandomState`
+        Parent seed. See :py:func:`get_random_state`.
+    num : int
+        Number of child seeds.
+
+    Returns
+    -------
+    seeds : list
+        List of num integer seeds.
+
+    """
+    random_state = get_random_state(seed)
+    seeds = random_state.randint(np.iinfo(np.int32).max, size=num)
+    return seeds.tolist()
@@ -0,0 +1,54 @@
+"""Module for ahead of time compilation of numba kernels.
+
+All numba kernels in :py:mod:`ollin` are compiled with an explicit signature
+and with ``cache=True``, so that compiled machine code is stored on disk (in
+the ``__pycache__`` directory next to the source file, or in the directory
+given by the ``NUMBA_CACHE_DIR`` environment variable if the package is not
+writable) and loaded on later imports instead of being compiled again.
+
+Kernels are compiled, or loaded from cache, when the module defining them is
+imported. Movement models are only imported when first requested, so a
+process that uses several of them would compile each one at first use.
+Calling :py:func:`warmup` once, for instance after installation or at the
+start of a batch job before forking worker processes, compiles all kernels
+and fills the disk cache, so that short lived processes start immediately.
+
+"""
+from importlib import import_module
+import logging
+import time
+
+from ..movement_models import get_movement_model_list
+
+
+logger = logging.getLogger(__name__)
+
+KERNEL_MODULES = [
+    'ollin.core.rng',
+    'ollin.core.occupancy',
+    'ollin.core.home_range',
+    'ollin.home_range_estimators.mcp',
+    'ollin.core.detection',
+]
+
+
+def warmup():
+    """Compile all numba kernels and store them in the disk cache.
+
+    Returns
+    -------
+    modules : list
+        Names of all imported modules holding numba kernels.
+
+    """
+    modules = KERNEL_MODULES + [
+        'ollin.movement_models.{}'.format(model)
+        for model in sorted(get_movement_model_list())]
+
+    start = time.time()
+    for module in modules:
+        import_module(module)
+    logger.info(
+        'Compiled %d modules in %.2f seconds', len(modules),
+        time.time() - start)
+    return modules
@@ -0,0 +1,41 @@
+from importlib import import_module
+import os
+import glob
+
+try:
+    from functools import lru_cache
+except ImportError:
+    from backports.functools_lru_cache import lru_cache
+
+
+@lru_cache()
+def get_home_range_estimator(estimator):
+    estimator_path = os.path.dirname(os.path.abspath(__file__))
+    estimator_path = os.path.join(
+            estimator_path, '{}.py'.format(estimator))
+
+    if os.path.exists(estimator_path):
+        try:
+            module = import_module(
+                    'ollin.home_range_estimators.{}'.format(estimator))
+            return module.Estimator
+        except Exception as e:
+            print('Unexpected exception occured while loading model file')
+            raise e
+
+    else:
+        msg = 'Home range estimator {} not implemented'.format(estimator)
+        raise NotImplementedError(msg)
+
+
+def get_home_range_estimator_list():
+    """Return all home range estimators in library."""
+    path = os.path.dirname(os.path.abspath(__file__))
+    python_files = [
+            os.path.basename(module)[:-3]
+            for module in glob.glob(os.path.join(path, '*.py'))]
+    home_range_estimators = [
+            module for module in python_files
+            if (module != '__init__') and (module != 'base')]
+
+    return home_range_estimators
@@ -0,0 +1,124 @@
+"""Interface for all home range estimators"""
+
+from abc import abstractmethod, ABCMeta
+import six
+import numpy as np
+
+
+@six.add_metaclass(ABCMeta)
+class HomeRangeEstimator():
+    """Base class for all home range estimators.
+
+    All home range estimators must subclass this class and implement the
+    estimate method. A name for the estimator must also be provided.
+
+    Home range estimators must read positions through the array, indices and
+    scale attributes of movement data (see :py:class:`.MovementData`), so
+    that they work on memory mapped, quantized or subsampled movement
+    without copying it.
+
+    Attributes
+    ----------
+    name : str
+        Name of estimator.
+    default_parameters : dict
+        Default values of estimator parameters.
+    parameters : dict
+        Parameters used in estimation.
+    movement : :py:obj:`.MovementData`
+        Reference to the movement data from which home range was estimated.
+    home_ranges : :py:obj:`array`
+        Array of shape [num_individuals] holding the home range in Km^2 for
+        each individual.
+    mean_home_range : float
+        Average home range.
+
+    """
+
+    default_parameters = {}
+
+    @property
+    @abstractmethod
+    def name(self):
+        pass
+
+    def __init__(self, movement, parameters=None):
+        """Construct a home range estimator.
+
+        Arguments
+        ---------
+        movement: :py:obj:`.MovementData`
+            Movement data from which to estimate home range.
+        parameters : dict, optional
+            Estimator parameters. Missing values will be taken from the
+            default parameters of the estimator.
+
+        """
+        self.parameters = self.default_parameters.copy()
+        if parameters is not None:
+            self.parameters.update(parameters)
+
+        self.movement = movement
+        self.home_ranges = self.estimate(movement)
+        self.mean_home_range = self.home_ranges.mean()
+
+    @abstractmethod
+    def estimate(self, movement):
+        """Estimate home range of every individual in movement data.
+
+        This is an abstract method that must be overwritten by any
+        implementation.
+
+        Arguments
+        ---------
+        movement : :py:obj:`.MovementData`
+
+        Returns
+        -------
+        home_ranges : :py:obj:`array`
+            Array of shape [num_individuals] with the home range in Km^2 of
+            each individual.
+
+        """
+        pass
+
+    def plot(
+            self,
+            ax=None,
+            figsize=(10, 10),
+            bins=20,
+            color='blue',
+            alpha=0.8):
+        """Plot distribution of home ranges.
+
+        Arguments
+        ---------
+        ax : :py:obj:`matplotlib.axes.Axes`, optional
+            Axes object in which to plot.
+        figsize : tuple or list, optional
+            Size of figure to create if no axes are provided.
+        bins : int, optional
+            Number of bins to use in histogram. Defaults to 20.
+        color : str, optional
+            Color of histogram bars.
+        alpha : float, optional
+            Alpha value of plot. Defaults to 0.8.
+
+        Returns
+        -------
+        ax : :py:obj:`matplotlib.axes.Axes`
+            Returns axes for further plotting.
+
+        """
+        import matplotlib.pyplot as plt
+
+        if ax is None:
+            _, ax = plt.subplots(figsize=figsize)
+
+        ax.hist(self.home_ranges, bins=bins, color=color, alpha=alpha)
+        ax.axvline(np.mean(self.home_ranges), color='red')
+
+        ax.set_title('{} distribution'.format(self.name))
+        ax.set_xlabel('Home range (Km^2)')
+        ax.set_ylabel('Count')
+        return ax
@@ -0,0 +1,52 @@
+from .base import HomeRangeEstimator
+from ..core.home_range import _count_cells
+from ..core.utils import home_range_resolution
+
+
+class Estimator(HomeRangeEstimator):
+    """Grid cell count home range estimator.
+
+    Space is discretized into square cells and the home range of an
+    individual is the total area of the cells it visited. This is the
+    definition used throughout the package, see :py:mod:`.home_range`.
+
+    Parameters
+    ----------
+    resolution : float or None
+        Side of grid cells in Km. If None, it will be obtained from the
+        movement velocity with :py:func:`.home_range_resolution`, as in
+        :py:class:`.HomeRange`.
+
+    """
+    name = 'Grid Cell Count'
+    default_parameters = {
+        'resolution': None,
+    }
+
+    def estimate(self, movement):
+        """Count cells visited by each individual.
+
+        Arguments
+        ---------
+        movement : :py:obj:`.MovementData`
+            Movement data from which to estimate home range. Must have a
+            velocity attribute if no resolution is given.
+
+        Returns
+        -------
+        home_ranges : :py:obj:`array`
+            Array of shape [num_individuals] with the area in Km^2 of the
+            cells visited by each individual.
+
+        """
+        resolution = self.parameters['resolution']
+        if resolution is None:
+            resolution = home_range_resolution(movement.velocity)
+
+        counts = _count_cells(
+            movement.array,
+            movement.indices,
+            movement.scale,
+            movement.site.range,
+            resolution)
+        return counts * resolution ** 2
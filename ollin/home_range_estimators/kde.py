@@ -0,0 +1,159 @@
+from __future__ import division
+
+import numpy as np
+
+from .base import HomeRangeEstimator
+from ..core.constants import GLOBAL_CONSTANTS
+
+
+# Number of individuals whose densities are computed together.
+CHUNK_SIZE = 256
+
+
+class Estimator(HomeRangeEstimator):
+    r"""Kernel density home range estimator.
+
+    The utilization distribution of each individual is estimated with a
+    gaussian kernel density estimation over its recorded positions, and its
+    home range is the area of the smallest region that holds some fixed
+    proportion (the level, usually 95%) of the distribution.
+
+    Density is estimated on a grid: positions are binned into square cells
+    and the resulting histogram is convolved with a gaussian kernel through
+    the FFT, by multiplying its transform with the transform of the kernel.
+    As is common in home range software, each individual gets its own grid
+    with a fixed number of cells per side, covering its positions with a
+    margin of four bandwidths. Since all grids have the same shape, the
+    densities of many individuals are computed with a single batched FFT.
+    Cost is proportional to the number of grid cells, times its logarithm,
+    instead of the number of positions times the number of cells.
+
+    If no bandwidth is given, the reference bandwidth
+
+    .. math::
+
+        h = \sqrt{\frac{\sigma_x^2 + \sigma_y^2}{2}} n^{-1/6}
+
+    is used, where :math:`\sigma_x^2, \sigma_y^2` are the variances of the
+    coordinates and :math:`n` the number of positions.
+
+    Parameters
+    ----------
+    level : float
+        Proportion of utilization distribution to enclose. Defaults to 0.95.
+    bandwidth : float or None
+        Kernel bandwidth in Km. If None, the reference bandwidth of each
+        individual is used.
+    grid_size : int
+        Number of cells per side of the grid of each individual. Defaults
+        to 64.
+
+    """
+    name = 'Kernel Density'
+    default_parameters = {
+        'level': 0.95,
+        'bandwidth': None,
+        'grid_size': 64,
+    }
+
+    def estimate(self, movement):
+        """Compute kernel density home range of each individual.
+
+        Arguments
+        ---------
+        movement : :py:obj:`.MovementData`
+            Movement data from which to estimate home range.
+
+        Returns
+        -------
+        home_ranges : :py:obj:`array`
+            Array of shape [num_individuals] with the area in Km^2 of the
+            region holding the given level of the utilization distribution
+            of each individual.
+
+        """
+        home_ranges = np.zeros(movement.num)
+        indices = movement.indices
+        for start in range(0, movement.num, CHUNK_SIZE):
+            chunk = indices[start:start + CHUNK_SIZE]
+            positions = movement.array[chunk].astype(np.float64)
+            positions *= movement.scale
+            density, resolutions = _binned_density(
+                positions,
+                self.parameters['grid_size'],
+                self.parameters['bandwidth'])
+            cells = _level_cells(density, self.parameters['level'])
+            home_ranges[start:start + CHUNK_SIZE] = cells * resolutions ** 2
+        return home_ranges
+
+
+def _binned_density(positions, grid_size, bandwidth=None):
+    """Gaussian kernel density of positions on a grid, through the FFT.
+
+    Arguments
+    ---------
+    positions : array
+        Array of shape [num, steps, 2] with positions of a batch of
+        individuals.
+    grid_size : int
+        Number of cells per side of grids.
+    bandwidth : float, optional
+        Kernel bandwidth. If not given, the reference bandwidth of each
+        individual is used.
+
+    Returns
+    -------
+    density : array
+        Array of shape [num, grid_size, grid_size] with the density of each
+        individual, in a window that contains its positions.
+    resolutions : array
+        Array of shape [num] with the side of grid cells of each individual.
+
+    """
+    num, steps, _ = positions.shape
+    if bandwidth is None:
+        sigmas = np.sqrt(positions.var(axis=1).mean(axis=1))
+        bandwidths = sigmas * steps ** (-1 / 6)
+    else:
+        bandwidths = np.full(num, bandwidth, dtype=np.float64)
+    bandwidths = np.maximum(bandwidths, GLOBAL_CONSTANTS['quantum'])
+
+    # Windows leave a margin of four bandwidths around positions, so that
+    # the circular convolution does not wrap density around.
+    lower = positions.min(axis=1) - 4 * bandwidths[:, None]
+    upper = positions.max(axis=1) + 4 * bandwidths[:, None]
+    resolutions = (upper - lower).max(axis=1) / grid_size
+
+    cells = np.floor(
+        (positions - lower[:, None, :]) / resolutions[:, None, None])
+    cells = np.minimum(cells.astype(np.int64), grid_size - 1)
+
+    individuals = np.repeat(np.arange(num), steps).reshape(num, steps)
+    linear = (individuals * grid_size + cells[:, :, 0]) * grid_size
+    linear += cells[:, :, 1]
+    histogram = np.bincount(
+        linear.ravel(),
+        minlength=num * grid_size ** 2)
+    histogram = histogram.reshape([num, grid_size, grid_size])
+
+    # Fourier transform of gaussian kernels, with bandwidths in cell units.
+    frequencies = (
+        np.fft.fftfreq(grid_size)[:, None] ** 2 +
+        np.fft.rfftfreq(grid_size)[None, :] ** 2)
+    cell_bandwidths = bandwidths / resolutions
+    transfer = np.exp(
+        -2 * np.pi ** 2 * cell_bandwidths[:, None, None] ** 2 *
+        frequencies[None, :, :])
+
+    density = np.fft.irfft2(
+        np.fft.rfft2(histogram) * transfer,
+        s=(grid_size, grid_size))
+    return np.maximum(density, 0), resolutions
+
+
+def _level_cells(density, level):
+    """Number of highest density cells that hold level of total density."""
+    num = density.shape[0]
+    values = -np.sort(-density.reshape([num, -1]), axis=1)
+    cumulative = np.cumsum(values, axis=1)
+    return (cumulative < level * cumulative[:, -1:]).sum(axis=1) + 1
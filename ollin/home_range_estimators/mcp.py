@@ -0,0 +1,136 @@
+from six.moves import xrange
+import numpy as np
+from numba import jit, prange, float64, int64, types
+
+from .base import HomeRangeEstimator
+from ..core.movement import MOVEMENT_ARRAY_TYPES
+
+
+class Estimator(HomeRangeEstimator):
+    """Minimum convex polygon home range estimator.
+
+    The home range of an individual is the area of the smallest convex
+    polygon containing its recorded positions. Since a few excursions can
+    greatly enlarge the polygon, it is common in field studies to only use
+    some percentage of the positions, those closest to the mean position of
+    the individual.
+
+    Convex hulls of all individuals are computed in parallel with the
+    monotone chain algorithm.
+
+    Parameters
+    ----------
+    percentage : float
+        Percentage of positions, closest to the individual mean position, to
+        include in the polygon. Defaults to 100.
+
+    """
+    name = 'Minimum Convex Polygon'
+    default_parameters = {
+        'percentage': 100,
+    }
+
+    def estimate(self, movement):
+        """Compute minimum convex polygon area of each individual.
+
+        Arguments
+        ---------
+        movement : :py:obj:`.MovementData`
+            Movement data from which to estimate home range.
+
+        Returns
+        -------
+        home_ranges : :py:obj:`array`
+            Array of shape [num_individuals] with the area in Km^2 of the
+            minimum convex polygon of each individual.
+
+        """
+        return _polygon_areas(
+            movement.array,
+            movement.indices,
+            movement.scale,
+            float(self.parameters['percentage']))
+
+
+@jit(
+    types.UniTuple(float64[:], 2)(float64[:], float64[:], float64),
+    nopython=True,
+    cache=True)
+def _closest_points(xcoords, ycoords, percentage):
+    """Select percentage of points closest to their mean."""
+    distances = (
+        (xcoords - xcoords.mean()) ** 2 +
+        (ycoords - ycoords.mean()) ** 2)
+    num = int(np.ceil(xcoords.size * percentage / 100))
+    closest = np.argsort(distances)[:num]
+    return xcoords[closest], ycoords[closest]
+
+
+@jit(
+    float64(float64[:], float64[:]),
+    nopython=True,
+    cache=True)
+def _hull_area(xcoords, ycoords):
+    """Area of convex hull of points, with the monotone chain algorithm."""
+    num = xcoords.size
+    if num < 3:
+        return 0.0
+
+    # Lexicographic order by x and then y, using stable sorts.
+    order = np.argsort(ycoords, kind='mergesort')
+    order = order[np.argsort(xcoords[order], kind='mergesort')]
+
+    hull = np.empty(2 * num, dtype=np.int64)
+    size = 0
+    for start, stop, step in ((0, num, 1), (num - 2, -1, -1)):
+        # The upper chain must not remove points of the lower chain.
+        bottom = size + 1 if step == -1 else 2
+        for k in xrange(start, stop, step):
+            point = order[k]
+            while size >= bottom:
+                first = hull[size - 2]
+                second = hull[size - 1]
+                cross = (
+                    (xcoords[second] - xcoords[first]) *
+                    (ycoords[point] - ycoords[first]) -
+                    (ycoords[second] - ycoords[first]) *
+                    (xcoords[point] - xcoords[first]))
+                if cross > 0:
+                    break
+                size -= 1
+            hull[size] = point
+            size += 1
+
+    # Shoelace formula. Last point in hull is equal to the first.
+    area = 0.0
+    for k in xrange(size - 1):
+        first = hull[k]
+        second = hull[k + 1]
+        area += xcoords[first] * ycoords[second]
+        area -= xcoords[second] * ycoords[first]
+    return abs(area) / 2
+
+
+@jit(
+    [float64[:](array_type, int64[:], float64, float64)
+     for array_type in MOVEMENT_ARRAY_TYPES],
+    nopython=True,
+    parallel=True,
+    cache=True)
+def _polygon_areas(array, indices, scale, percentage):
+    num = indices.size
+    steps = array.shape[1]
+
+    areas = np.zeros(num)
+    for i in prange(num):
+        index = indices[i]
+        xcoords = np.empty(steps)
+        ycoords = np.empty(steps)
+        for s in xrange(steps):
+            xcoords[s] = array[index, s, 0] * scale
+            ycoords[s] = array[index, s, 1] * scale
+
+        if percentage < 100:
+            xcoords, ycoords = _closest_points(xcoords, ycoords, percentage)
+        areas[i] = _hull_area(xcoords, ycoords)
+    return areas
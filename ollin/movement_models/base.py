@@ -2,8 +2,12 @@
 
 from abc import abstractmethod, ABCMeta
 from six import iteritems, add_metaclass
+from six.moves import xrange
+import numpy as np
 
-from ..core.constants import MOVEMENT_PARAMETERS
+from ..core.constants import MOVEMENT_PARAMETERS, GLOBAL_CONSTANTS
+from ..core.rng import make_states
+from ..core.utils import num_threads
 
 
 @add_metaclass(ABCMeta)
@@ -75,10 +79,14 @@ class MovementModel(object):
             initial_position,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         """Generate simulated movement from initial positions and conditions.
 
         This is an abstract method that must be implemented in any subclass.
+        Initial positions are updated in place to the positions reached at
+        the end of the simulation.
 
         Arguments
         ---------
@@ -91,14 +99,110 @@ class MovementModel(object):
             Number of steps to simulate.
         velocity : int
             Mean velocity of individuals.
+        random_states : array, optional
+            Array of shape [num] and type uint64 with the state of the random
+            stream of each individual (see :py:mod:`.rng`). States are
+            advanced in place. If not given, new states will be drawn from
+            numpy's global random state.
+        record_every : int, optional
+            Only positions at every record_every-th step are stored in the
+            output array, while movement is still simulated at every step.
+            Defaults to 1, i.e. all positions are stored.
 
         Returns
         -------
         array : array
-            Array of shape [num, steps, 2], so if (x, y) = Array[i, j, :] then
-            x and y are the coordinates of the i-th individual at step j in the
-            simulation. Number of steps is determined by number of days and
-            steps per day parameter.
+            Array of shape [num, recorded_steps, 2], so if (x, y) =
+            Array[i, j, :] then x and y are the coordinates of the i-th
+            individual at step j * record_every in the simulation. Number of
+            recorded steps is steps / record_every, rounded up.
 
         """
         pass
+
+    def generate_movement_stream(
+            self,
+            initial_position,
+            site,
+            steps,
+            velocity,
+            block_size=None,
+            random_states=None,
+            n_threads=None,
+            record_every=1):
+        """Generate simulated movement in blocks of time steps.
+
+        Instead of allocating the full array of shape [num, steps, 2] this
+        method yields consecutive blocks of at most block_size time steps.
+        Positions at the end of each block are used as starting points of the
+        next one, and random state is carried along, so the concatenation of
+        all blocks is a single continuous simulation. This allows consumers to
+        reduce movement data on the fly with bounded memory.
+
+        Arguments
+        ---------
+        initial_position : array
+            Array of initial positions of shape [num, 2] to specify coordinates
+            of individuals to be simulated. This array will not be modified.
+        site: :py:obj:`.Site`
+            Site in which to simulate movement.
+        steps : int
+            Total number of steps to simulate.
+        velocity : int
+            Mean velocity of individuals.
+        block_size : int, optional
+            Maximum number of time steps per block. If not given it will be
+            taken from the global constants. See :py:const:`.GLOBAL_CONSTANTS`.
+        random_states : array, optional
+            Array of shape [num] and type uint64 with the state of the random
+            stream of each individual. If not given, new states will be drawn
+            from numpy's global random state. Results do not depend on the
+            block size.
+        n_threads : int, optional
+            Number of threads to use in simulation. If not given, numba's
+            default will be used. Results do not depend on the number of
+            threads.
+        record_every : int, optional
+            Only store positions at every record_every-th step. Block size is
+            rounded down to a multiple of record_every, so that recorded
+            steps are the same as in a single simulation. See
+            :py:meth:`generate_movement`.
+
+        Yields
+        ------
+        block : array
+            Array of shape [num, block_steps, 2] with the positions of all
+            individuals at the recorded time steps of the block.
+
+        Raises
+        ------
+        ValueError
+            If record_every is less than 1.
+
+        """
+        if record_every < 1:
+            msg = 'Argument record_every must be at least 1. {} given.'
+            raise ValueError(msg.format(record_every))
+
+        if block_size is None:
+            block_size = GLOBAL_CONSTANTS['block_size']
+        block_size = max(block_size // record_every, 1) * record_every
+
+        # Movement kernels update positions in place. Copy to leave the
+        # caller's array untouched and to carry positions between blocks.
+        positions = np.array(initial_position, dtype=np.float64)
+
+        if random_states is None:
+            random_states = make_states(len(positions))
+
+        for start in xrange(0, steps, block_size):
+            block_steps = min(block_size, steps - start)
+            with num_threads(n_threads):
+                block = self.generate_movement(
+                    positions,
+                    site,
+                    block_steps,
+                    velocity,
+                    random_states=random_states,
+                    record_every=record_every)
+            yield block
@@ -1,8 +1,9 @@
 from six.moves import xrange
 import numpy as np
-from numba import jit, float64, int64
+from numba import jit, prange, float64, int64, uint64
 
 from .base import MovementModel
+from ..core.rng import make_states, normal
 
 
 class Model(MovementModel):
@@ -30,39 +31,54 @@ class Model(MovementModel):
             initial_positions,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         range_ = site.range
+        if random_states is None:
+            random_states = make_states(len(initial_positions))
         mov = self._movement(
             initial_positions,
+            random_states,
             velocity,
             range_,
-            steps)
+            steps,
+            record_every)
         return mov
 
     @staticmethod
     @jit(
         float64[:, :, :](
             float64[:, :],
+            uint64[:],
             float64,
             float64[:],
+            int64,
             int64),
-        nopython=True)
+        nopython=True,
+        parallel=True,
+        cache=True)
     def _movement(
             random_positions,
+            random_states,
             velocity,
             range_,
-            steps):
+            steps,
+            record_every):
         num, _ = random_positions.shape
-        movement = np.zeros((num, steps, 2), dtype=float64)
+        recorded = (steps + record_every - 1) // record_every
+        movement = np.zeros((num, recorded, 2), dtype=float64)
         sigma = velocity / 1.2533141373155003
         rangex, rangey = range_
-        directions = np.random.normal(
-            0, sigma, size=(steps, num, 2))
 
-        for k in xrange(steps):
-            movement[:, k, :] = random_positions
-            for j in xrange(num):
-                direction = directions[k, j]
+        for j in prange(num):
+            for k in xrange(steps):
+                if k % record_every == 0:
+                    movement[j, k // record_every, 0] = random_positions[j, 0]
+                    movement[j, k // record_every, 1] = random_positions[j, 1]
+                direction = (
+                    sigma * normal(random_states, j),
+                    sigma * normal(random_states, j))
                 tmp1 = (
                     random_positions[j, 0] + direction[0],
                     random_positions[j, 1] + direction[1])
@@ -1,9 +1,10 @@
 from six.moves import xrange
 import numpy as np
 import math
-from numba import jit, float64, int64
+from numba import jit, prange, float64, int64, uint64
 
 from .base import MovementModel
+from ..core.rng import make_states, uniform
 
 
 class Model(MovementModel):
@@ -32,15 +33,22 @@ class Model(MovementModel):
             initial_positions,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         exponent = self.parameters['movement']['pareto']
         range_ = site.range
 
+        if random_states is None:
+            random_states = make_states(len(initial_positions))
+
         mov = self._movement(
             initial_positions,
+            random_states,
             velocity,
             range_,
             steps,
+            record_every,
             exponent)
         return mov
 
@@ -48,28 +56,37 @@ class Model(MovementModel):
     @jit(
         float64[:, :, :](
             float64[:, :],
+            uint64[:],
             float64,
             float64[:],
             int64,
+            int64,
             float64),
-        nopython=True)
+        nopython=True,
+        parallel=True,
+        cache=True)
     def _movement(
             random_positions,
+            random_states,
             velocity,
             range_,
             steps,
+            record_every,
             exponent):
         num, _ = random_positions.shape
-        movement = np.zeros((num, steps, 2), dtype=float64)
-        random_angles = np.random.uniform(0.0, 2 * np.pi, size=(steps, num))
+        recorded = (steps + record_every - 1) // record_every
+        movement = np.zeros((num, recorded, 2), dtype=float64)
         rangex, rangey = range_
-        for k in xrange(steps):
-            movement[:, k, :] = random_positions
-            for j in xrange(num):
-                angle = random_angles[k, j]
+        for j in prange(num):
+            for k in xrange(steps):
+                if k % record_every == 0:
+                    movement[j, k // record_every, 0] = random_positions[j, 0]
+                    movement[j, k // record_every, 1] = random_positions[j, 1]
+                angle = 2 * np.pi * uniform(random_states, j)
                 heading = (math.cos(angle), math.sin(angle))
                 magnitude = (velocity * (exponent - 1)) / \
-                    (math.pow((1 - np.random.rand()), 1/exponent) * exponent)
+                    (math.pow((1 - uniform(random_states, j)), 1/exponent) *
+                     exponent)
                 direction = (magnitude * heading[0], magnitude * heading[1])
                 tmp1 = (
                     random_positions[j, 0] + direction[0],
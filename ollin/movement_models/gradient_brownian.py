@@ -1,9 +1,10 @@
 from six.moves import xrange
 import math
 import numpy as np
-from numba import jit, float64, int64
+from numba import jit, prange, float64, int64, uint64
 
 from .base import MovementModel
+from ..core.rng import make_states, normal
 
 
 class Model(MovementModel):
@@ -33,7 +34,9 @@ class Model(MovementModel):
             initial_positions,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         grad_weight = self.parameters['movement']['grad_weight']
         niche_weight = self.parameters['movement']['niche_weight']
 
@@ -43,14 +46,19 @@ class Model(MovementModel):
 
         gradient = np.stack(np.gradient(heatmap), -1)
 
+        if random_states is None:
+            random_states = make_states(len(initial_positions))
+
         mov = self._movement(
             gradient,
             heatmap,
             initial_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             grad_weight,
             niche_weight)
         return mov
@@ -61,33 +69,41 @@ class Model(MovementModel):
             float64[:, :, :],
             float64[:, :],
             float64[:, :],
+            uint64[:],
             float64,
             float64,
             float64[:],
             int64,
+            int64,
             float64,
             float64),
-        nopython=True)
+        nopython=True,
+        parallel=True,
+        cache=True)
     def _movement(
             gradient,
             heatmap,
             random_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             grad_weight,
             niche_weight):
         num, _ = random_positions.shape
-        movement = np.zeros((num, steps, 2), dtype=float64)
+        recorded = (steps + record_every - 1) // record_every
+        movement = np.zeros((num, recorded, 2), dtype=float64)
         rangex, rangey = range_
-        directions = np.random.normal(0, 1, (num, steps))
         gradient = gradient[:, :, 0] + 1j * gradient[:, :, 1]
 
-        for k in xrange(steps):
-            movement[:, k, :] = random_positions
-            for j in xrange(num):
-                direction = directions[j, k]
+        for j in prange(num):
+            for k in xrange(steps):
+                if k % record_every == 0:
+                    movement[j, k // record_every, 0] = random_positions[j, 0]
+                    movement[j, k // record_every, 1] = random_positions[j, 1]
+                direction = normal(random_states, j)
                 index = (
                     random_positions[j, 0] // resolution,
                     random_positions[j, 1] // resolution)
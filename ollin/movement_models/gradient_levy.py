@@ -1,9 +1,10 @@
 from six.moves import xrange
 import numpy as np
 import math
-from numba import jit, float64, int64
+from numba import jit, prange, float64, int64, uint64
 
 from .base import MovementModel
+from ..core.rng import make_states, uniform
 
 
 class Model(MovementModel):
@@ -31,7 +32,9 @@ class Model(MovementModel):
             initial_positions,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         min_exponent = self.parameters['movement']['min_pareto']
         max_exponent = self.parameters['movement']['max_pareto']
         grad_weight = self.parameters['movement']['grad_weight']
@@ -42,14 +45,19 @@ class Model(MovementModel):
 
         gradient = np.stack(np.gradient(heatmap), -1)
 
+        if random_states is None:
+            random_states = make_states(len(initial_positions))
+
         mov = self._movement(
             gradient,
             heatmap,
             initial_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             min_exponent,
             max_exponent,
             grad_weight)
@@ -61,38 +69,45 @@ class Model(MovementModel):
             float64[:, :, :],
             float64[:, :],
             float64[:, :],
+            uint64[:],
             float64,
             float64,
             float64[:],
             int64,
+            int64,
             float64,
             float64,
             float64),
-        nopython=True)
+        nopython=True,
+        parallel=True,
+        cache=True)
     def _movement(
             gradient,
             heatmap,
             random_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             min_exponent,
             max_exponent,
             grad_weight):
         num, _ = random_positions.shape
-        movement = np.zeros((num, steps, 2), dtype=float64)
+        recorded = (steps + record_every - 1) // record_every
+        movement = np.zeros((num, recorded, 2), dtype=float64)
         rangex, rangey = range_
-        directions = np.random.uniform(0, 1, size=(steps, num))
-        magnitudes = np.random.random((steps, num))
         exponent_var = max_exponent - min_exponent
         gradient = gradient[:, :, 0] + 1j * gradient[:, :, 1]
 
-        for k in xrange(steps):
-            movement[:, k, :] = random_positions
-            for j in xrange(num):
-                direction = directions[k, j]
-                magnitude = magnitudes[k, j]
+        for j in prange(num):
+            for k in xrange(steps):
+                if k % record_every == 0:
+                    movement[j, k // record_every, 0] = random_positions[j, 0]
+                    movement[j, k // record_every, 1] = random_positions[j, 1]
+                direction = uniform(random_states, j)
+                magnitude = uniform(random_states, j)
                 index = (
                     random_positions[j, 0] // resolution,
                     random_positions[j, 1] // resolution)
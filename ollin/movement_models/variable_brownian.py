@@ -1,8 +1,9 @@
 from six.moves import xrange
 import numpy as np
-from numba import jit, float64, int64
+from numba import jit, prange, float64, int64, uint64
 
 from .base import MovementModel
+from ..core.rng import make_states, normal
 
 
 class Model(MovementModel):
@@ -31,20 +32,27 @@ class Model(MovementModel):
             initial_positions,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         niche_weight = self.parameters['movement']['niche_weight']
 
         heatmap = site.niche
         resolution = site.resolution
         range_ = site.range
 
+        if random_states is None:
+            random_states = make_states(len(initial_positions))
+
         mov = self._movement(
             heatmap,
             initial_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             niche_weight)
         return mov
 
@@ -53,36 +61,45 @@ class Model(MovementModel):
         float64[:, :, :](
             float64[:, :],
             float64[:, :],
+            uint64[:],
             float64,
             float64,
             float64[:],
             int64,
+            int64,
             float64),
-        nopython=True)
+        nopython=True,
+        parallel=True,
+        cache=True)
     def _movement(
             heatmap,
             random_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             niche_weight):
         num, _ = random_positions.shape
-        movement = np.zeros((num, steps, 2), dtype=float64)
+        recorded = (steps + record_every - 1) // record_every
+        movement = np.zeros((num, recorded, 2), dtype=float64)
         sigma = velocity / 1.2533141373155003
         rangex, rangey = range_
-        directions = np.random.normal(
-            0, sigma, size=(steps, num, 2))
 
-        for k in xrange(steps):
-            movement[:, k, :] = random_positions
-            for j in xrange(num):
-                direction = directions[k, j]
+        for j in prange(num):
+            for k in xrange(steps):
+                if k % record_every == 0:
+                    movement[j, k // record_every, 0] = random_positions[j, 0]
+                    movement[j, k // record_every, 1] = random_positions[j, 1]
                 index = (
                     random_positions[j, 0] // resolution,
                     random_positions[j, 1] // resolution)
                 value = heatmap[int(index[0]), int(index[1])]
-                direction *= 1 + niche_weight * (0.5 - value)
+                weight = 1 + niche_weight * (0.5 - value)
+                direction = (
+                    weight * sigma * normal(random_states, j),
+                    weight * sigma * normal(random_states, j))
                 tmp1 = (
                     random_positions[j, 0] + direction[0],
                     random_positions[j, 1] + direction[1])
@@ -1,9 +1,10 @@
 from six.moves import xrange
 import math
 import numpy as np
-from numba import jit, float64, int64
+from numba import jit, prange, float64, int64, uint64
 
 from .base import MovementModel
+from ..core.rng import make_states, uniform
 
 
 class Model(MovementModel):
@@ -33,7 +34,9 @@ class Model(MovementModel):
             initial_positions,
             site,
             steps,
-            velocity):
+            velocity,
+            random_states=None,
+            record_every=1):
         min_exponent = self.parameters['movement']['min_pareto']
         max_exponent = self.parameters['movement']['max_pareto']
 
@@ -41,13 +44,18 @@ class Model(MovementModel):
         resolution = site.resolution
         range_ = site.range
 
+        if random_states is None:
+            random_states = make_states(len(initial_positions))
+
         mov = self._movement(
                 heatmap,
                 initial_positions,
+                random_states,
                 resolution,
                 velocity,
                 range_,
                 steps,
+                record_every,
                 min_exponent,
                 max_exponent)
         return mov
@@ -57,32 +65,40 @@ class Model(MovementModel):
         float64[:, :, :](
             float64[:, :],
             float64[:, :],
+            uint64[:],
             float64,
             float64,
             float64[:],
             int64,
+            int64,
             float64,
             float64),
-        nopython=True)
+        nopython=True,
+        parallel=True,
+        cache=True)
     def _movement(
             heatmap,
             random_positions,
+            random_states,
             resolution,
             velocity,
             range_,
             steps,
+            record_every,
             min_exponent,
             max_exponent):
         num, _ = random_positions.shape
-        movement = np.zeros((num, steps, 2), dtype=float64)
-        random_angles = np.random.uniform(0.0, 2 * np.pi, size=(steps, num))
+        recorded = (steps + record_every - 1) // record_every
+        movement = np.zeros((num, recorded, 2), dtype=float64)
         rangex, rangey = range_
         exponent_var = max_exponent - min_exponent
 
-        for k in xrange(steps):
-            movement[:, k, :] = random_positions
-            for j in xrange(num):
-                angle = random_angles[k, j]
+        for j in prange(num):
+            for k in xrange(steps):
+                if k % record_every == 0:
+                    movement[j, k // record_every, 0] = random_positions[j, 0]
+                    movement[j, k // record_every, 1] = random_positions[j, 1]
+                angle = 2 * np.pi * uniform(random_states, j)
                 heading = (math.cos(angle), math.sin(angle))
                 index = (
                         random_positions[j, 0] // resolution,
@@ -90,7 +106,8 @@ class Model(MovementModel):
                 value = heatmap[int(index[0]), int(index[1])]
                 exponent = min_exponent + exponent_var * value
                 magnitude = (velocity * (exponent - 1)) / \
-                    (math.pow((1 - np.random.rand()), 1/exponent) * exponent)
+                    (math.pow((1 - uniform(random_states, j)), 1/exponent) *
+                     exponent)
                 direction = (magnitude * heading[0], magnitude * heading[1])
                 tmp1 = (
                         random_positions[j, 0] + direction[0],
@@ -0,0 +1,128 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+
+
+def brute_force_detection(movement, cam):
+    directions = cam.directions[:, 0] + 1j * cam.directions[:, 1]
+    relative = movement.data[:, :, None, :] - cam.positions[None, None]
+    relative = relative[..., 0] + 1j * relative[..., 1]
+    close = np.abs(relative) < cam.cone_range
+    angles = np.abs(np.angle(relative / directions))
+    return close & (angles < np.pi * cam.cone_angle / 360.0)
+
+
+class TestDetection(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=5)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=50, days=30, velocity=0.5)
+
+    def test_detection_grid(self):
+        cam = ollin.CameraConfiguration.make_random(
+            30, self.site, cone_range=0.3, cone_angle=90)
+        detection = cam.detect(self.mov)
+        expected = brute_force_detection(self.mov, cam)
+
+        self.assertTrue(expected.any())
+        self.assertTrue((detection.grid == expected).all())
+        self.assertTrue(
+            (detection.detections == expected.any(axis=0)).all())
+
+    def test_detection_events(self):
+        cam = ollin.CameraConfiguration.make_random(
+            30, self.site, cone_range=0.3, cone_angle=90)
+        events = cam.detect(self.mov).events
+        grid = events.to_grid()
+
+        self.assertEqual(events.num_events, grid.sum())
+        self.assertTrue(
+            (events.camera_counts() == grid.sum(axis=(0, 1))).all())
+        self.assertTrue(
+            (events.capture_histories() == grid.any(axis=2)).all())
+        for individual in range(self.mov.num):
+            self.assertTrue(
+                (events.capture_history(individual) ==
+                 grid[individual]).all())
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'events.npz')
+            events.save(path)
+            loaded = ollin.DetectionEvents.load(path)
+            self.assertTrue((loaded.to_grid() == grid).all())
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_detect_many(self):
+        cams = [
+            ollin.CameraConfiguration.make_random(
+                10, self.site, cone_range=0.3, cone_angle=90),
+            ollin.CameraConfiguration.make_grid(
+                1, self.site, cone_range=0.2, cone_angle=180),
+            ollin.CameraConfiguration.make_random(
+                20, self.site, cone_range=0.5, cone_angle=30)]
+        detections = ollin.detect_many(self.mov, cams)
+
+        self.assertEqual(len(detections), 3)
+        for cam, detection in zip(cams, detections):
+            self.assertIs(detection.camera_configuration, cam)
+            expected = brute_force_detection(self.mov, cam)
+            self.assertTrue((detection.grid == expected).all())
+
+    def test_random_camera_min_distance(self):
+        cam = ollin.CameraConfiguration.make_random(
+            100, self.site, min_distance=0.2)
+        positions = cam.positions
+        self.assertEqual(positions.shape, (100, 2))
+        self.assertTrue((positions >= 0).all())
+        self.assertTrue((positions < self.site.range).all())
+
+        distances = np.sqrt(
+            ((positions[:, None, :] - positions[None, :, :])**2).sum(-1))
+        np.fill_diagonal(distances, np.inf)
+        self.assertTrue(distances.min() > 0.2)
+
+        with self.assertRaises(RuntimeError):
+            ollin.CameraConfiguration.make_random(
+                1000, self.site, min_distance=1)
+
+    def test_random_camera_small_min_distance(self):
+        site = ollin.Site.make_random(0.5, range=20)
+        cam = ollin.CameraConfiguration.make_random(
+            10, site, min_distance=0.001, seed=3)
+        positions = cam.positions
+        self.assertEqual(positions.shape, (10, 2))
+        self.assertTrue((positions >= 0).all())
+        self.assertTrue((positions < site.range).all())
+
+        distances = np.sqrt(
+            ((positions[:, None, :] - positions[None, :, :])**2).sum(-1))
+        np.fill_diagonal(distances, np.inf)
+        self.assertTrue(distances.min() > 0.001)
+
+    def test_random_camera_only_niche(self):
+        niche = self.site.get_true_niche(self.site.niche)
+        sides = np.array(niche.shape)
+        for min_distance in [None, 0.1]:
+            cam = ollin.CameraConfiguration.make_random(
+                20, self.site, min_distance=min_distance, only_niche=True)
+            indices = (cam.positions * sides / self.site.range).astype(int)
+            indices = np.minimum(indices, sides - 1)
+            self.assertTrue(niche[indices[:, 0], indices[:, 1]].all())
+
+    def test_random_camera_seed(self):
+        for min_distance in [None, 0.2]:
+            cams = [
+                ollin.CameraConfiguration.make_random(
+                    30, self.site, min_distance=min_distance, seed=5)
+                for _ in range(2)]
+            self.assertTrue((cams[0].positions == cams[1].positions).all())
+            self.assertTrue(
+                (cams[0].directions == cams[1].directions).all())
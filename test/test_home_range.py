@@ -0,0 +1,107 @@
+import unittest
+import numpy as np
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+from ollin.core.home_range import make_grid  # noqa: E402
+
+
+class TestHomeRange(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=20, days=30, home_range=1.0)
+
+    def test_cell_counts(self):
+        hr = ollin.HomeRange(self.mov)
+        grid = make_grid(self.mov.data, self.site.range, hr.resolution)
+
+        self.assertTrue(np.allclose(hr.home_ranges, grid.sum(axis=(1, 2))))
+        self.assertTrue((hr.grid == grid).all())
+
+        selection = [2, 7, 11]
+        view = ollin.HomeRange(self.mov.select(selection))
+        self.assertTrue(
+            np.allclose(view.home_ranges, hr.home_ranges[selection]))
+
+        mov = ollin.Movement.simulate(
+            self.site, num=5, days=10, velocity=1, seed=5)
+        hr = ollin.HomeRange(mov)
+        self.assertEqual(hr.home_ranges.dtype, np.float64)
+        self.assertEqual(hr.growth_curve([5, 10]).dtype, np.float64)
+        self.assertTrue(
+            (hr.home_ranges == ollin.HomeRange.simulate(
+                self.site, num=5, days=10, velocity=1, seed=5).home_ranges
+             ).all())
+
+    def test_simulate(self):
+        mov = ollin.Movement.simulate(
+            self.site, num=10, days=20, velocity=0.3, seed=5)
+        hr = ollin.HomeRange.simulate(
+            self.site, num=10, days=20, velocity=0.3, seed=5, block_size=7)
+
+        self.assertTrue(
+            (hr.home_ranges == ollin.HomeRange(mov).home_ranges).all())
+        self.assertIsNone(hr.movement)
+        with self.assertRaises(ValueError):
+            hr.grid
+
+        hr = ollin.HomeRange.simulate(
+            self.site, num=10, days=0, velocity=0.3, seed=5)
+        self.assertEqual(hr.resolution, ollin.HomeRange(mov).resolution)
+        self.assertTrue((hr.home_ranges == 0).all())
+
+    def test_growth_curve(self):
+        hr = ollin.HomeRange(self.mov)
+        times = [0, 5.5, 12, 30]
+        growth = hr.growth_curve(times)
+
+        self.assertEqual(growth.shape, (20, 4))
+        self.assertTrue(np.allclose(growth[:, -1], hr.home_ranges))
+        for column, time in enumerate(times[:-1]):
+            steps = np.searchsorted(self.mov.times, time, side='right')
+            partial = ollin.HomeRange(self.mov.time_slice(slice(0, steps)))
+            self.assertTrue(
+                np.allclose(growth[:, column], partial.home_ranges))
+
+
+class TestHomeRangeEstimators(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=20, days=30, home_range=1.0)
+
+    def test_library(self):
+        estimators = ollin.get_home_range_estimator_list()
+        self.assertEqual(sorted(estimators), ['grid', 'kde', 'mcp'])
+
+        for name in estimators:
+            estimator = self.mov.estimate_home_range(name)
+            self.assertEqual(estimator.home_ranges.shape, (20,))
+            self.assertTrue((estimator.home_ranges > 0).all())
+
+        grid = self.mov.estimate_home_range('grid')
+        hr = ollin.HomeRange(self.mov)
+        self.assertTrue(np.allclose(grid.home_ranges, hr.home_ranges))
+
+        with self.assertRaises(NotImplementedError):
+            self.mov.estimate_home_range('not_an_estimator')
+
+    def test_mcp(self):
+        square = np.array([[1, 1], [3, 1], [2, 2], [3, 3], [1, 3], [2, 1]])
+        data = np.stack([square, square * 2], 0).astype(np.float64)
+        mov = ollin.MovementData(self.site, data, np.arange(6))
+
+        mcp = mov.estimate_home_range('mcp')
+        self.assertTrue(np.allclose(mcp.home_ranges, [4, 16]))
+
+    def test_kde(self):
+        random_state = np.random.RandomState(0)
+        data = random_state.normal(size=(1, 5000, 2)) * 0.5 + 5
+        mov = ollin.MovementData(self.site, data, np.arange(5000))
+
+        # Area of 95% region of a bivariate normal distribution.
+        area = -2 * np.log(0.05) * np.pi * 0.25
+        kde = mov.estimate_home_range('kde', parameters={'grid_size': 128})
+        self.assertLess(abs(kde.home_ranges[0] - area) / area, 0.1)
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import unittest
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = [
+    'numba',
+    'scipy',
+    'ollin.core.detection',
+    'ollin.core.occupancy',
+    'ollin.estimation',
+    'ollin.calibration',
+]
+
+IMPORT_BUDGET = 0.5
+
+
+def run_import(statement):
+    code = '\n'.join([
+        'import json, sys, time',
+        'start = time.time()',
+        statement,
+        'elapsed = time.time() - start',
+        'print(json.dumps([elapsed, sorted(sys.modules)]))'])
+    env = dict(os.environ)
+    paths = [ROOT]
+    if 'PYTHONPATH' in env:
+        paths.append(env['PYTHONPATH'])
+    env['PYTHONPATH'] = os.pathsep.join(paths)
+    output = subprocess.check_output(
+        [sys.executable, '-c', code], cwd=ROOT, env=env)
+    elapsed, modules = json.loads(output.decode('utf-8'))
+    return elapsed, set(modules)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'Requires module __getattr__')
+class TestLazyImport(unittest.TestCase):
+    def test_import_budget(self):
+        elapsed, modules = run_import('import ollin')
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+    def test_site_import(self):
+        _, modules = run_import('import ollin; ollin.Site')
+        self.assertIn('ollin.core.sites', modules)
+        self.assertNotIn('numba', modules)
+        self.assertNotIn('ollin.core.detection', modules)
+        self.assertNotIn('scipy.signal', modules)
+
+    def test_public_names(self):
+        for name in ollin.__all__:
+            self.assertTrue(hasattr(ollin, name))
+        self.assertIn('Movement', dir(ollin))
+
+        with self.assertRaises(AttributeError):
+            ollin.not_a_name
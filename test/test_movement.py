@@ -0,0 +1,383 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+
+
+class TestMovementStream(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+
+    def test_stream_blocks(self):
+        blocks = list(ollin.Movement.simulate_stream(
+            self.site,
+            num=5,
+            days=10,
+            velocity=0.5,
+            movement_model='constant_brownian',
+            block_size=7))
+
+        steps = sum(block.steps for block in blocks)
+        self.assertEqual(steps, 40)
+        self.assertTrue(all(block.steps <= 7 for block in blocks))
+        self.assertTrue(all(block.num == 5 for block in blocks))
+
+        times = np.concatenate([block.times for block in blocks])
+        self.assertTrue(np.allclose(times, np.arange(40) / 4))
+
+        data = np.concatenate([block.data for block in blocks], 1)
+        self.assertTrue((data >= 0).all())
+        self.assertTrue((data <= self.site.range).all())
+
+    def test_stream_does_not_modify_initial_positions(self):
+        model = ollin.get_movement_model('variable_levy')
+        initial = self.site.sample(3)
+        copy = initial.copy()
+        for _ in model.generate_movement_stream(
+                initial, self.site, 20, 0.1, block_size=6):
+            pass
+        self.assertTrue((initial == copy).all())
+
+
+class TestMovementReproducibility(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.initial = self.site.sample(16)
+        self.states = ollin.core.rng.make_states(16)
+
+    def _run(self, name, n_threads):
+        model = ollin.get_movement_model(name)
+        with ollin.core.utils.num_threads(n_threads):
+            return model.generate_movement(
+                self.initial.copy(),
+                self.site,
+                30,
+                0.1,
+                random_states=self.states.copy())
+
+    def test_threads(self):
+        for name in ollin.get_movement_model_list():
+            single = self._run(name, 1)
+            multiple = self._run(name, 4)
+            self.assertTrue((single == multiple).all())
+
+    def test_stream_matches_single_run(self):
+        model = ollin.get_movement_model('variable_levy')
+        single = model.generate_movement(
+            self.initial.copy(),
+            self.site,
+            30,
+            0.1,
+            random_states=self.states.copy())
+        blocks = model.generate_movement_stream(
+            self.initial,
+            self.site,
+            30,
+            0.1,
+            block_size=7,
+            random_states=self.states.copy())
+        streamed = np.concatenate(list(blocks), 1)
+        self.assertTrue((single == streamed).all())
+
+
+class TestSeed(unittest.TestCase):
+    def test_simulate_seed(self):
+        movements = []
+        for _ in range(2):
+            site = ollin.Site.make_random(0.5, range=10, seed=7)
+            movements.append(ollin.Movement.simulate(
+                site, num=5, days=5, velocity=0.5, seed=3))
+        self.assertTrue((movements[0].data == movements[1].data).all())
+
+        other = ollin.Movement.simulate(
+            site, num=5, days=5, velocity=0.5, seed=4)
+        self.assertFalse((movements[0].data == other.data).all())
+
+    def test_stream_seed(self):
+        site = ollin.Site.make_random(0.5, range=10, seed=7)
+        mov = ollin.Movement.simulate(
+            site, num=5, days=5, velocity=0.5, seed=3)
+        blocks = ollin.Movement.simulate_stream(
+            site, num=5, days=5, velocity=0.5, seed=3, block_size=6)
+        data = np.concatenate([block.data for block in blocks], 1)
+        self.assertTrue((mov.data == data).all())
+
+
+class TestMovementStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=10, days=5, home_range=1.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_save_open(self):
+        self.mov.save(self.directory)
+        mov = ollin.MovementData.open(self.directory)
+
+        self.assertIsInstance(mov, ollin.Movement)
+        self.assertIsInstance(mov.data, np.memmap)
+        self.assertTrue((mov.data == self.mov.data).all())
+        self.assertTrue((mov.times == self.mov.times).all())
+        self.assertTrue((mov.site.niche == self.site.niche).all())
+        self.assertEqual(mov.home_range, self.mov.home_range)
+        self.assertEqual(mov.velocity, self.mov.velocity)
+        self.assertEqual(
+            mov.movement_model.parameters,
+            self.mov.movement_model.parameters)
+
+        self.assertTrue((
+            ollin.Occupancy(mov).visits ==
+            ollin.Occupancy(self.mov).visits).all())
+        self.assertTrue((
+            ollin.HomeRange(mov).home_ranges ==
+            ollin.HomeRange(self.mov).home_ranges).all())
+
+        cam = ollin.CameraConfiguration.make_grid(2, self.site)
+        self.assertTrue((
+            cam.detect(mov.num_slice((2, 8))).grid ==
+            cam.detect(self.mov.num_slice((2, 8))).grid).all())
+
+    def test_open_movement_data(self):
+        data = ollin.MovementData(
+            self.site, self.mov.data, self.mov.times)
+        data.save(self.directory)
+        loaded = ollin.MovementData.open(self.directory, mmap=False)
+
+        self.assertNotIsInstance(loaded, ollin.Movement)
+        self.assertNotIsInstance(loaded.data, np.memmap)
+        self.assertTrue((loaded.data == data.data).all())
+
+
+class TestMovementViews(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=20, days=5, home_range=1.0)
+
+    def test_views_share_array(self):
+        sample = self.mov.sample(7)
+        views = [
+            (sample, sample.indices),
+            (self.mov.select([3, 1, 4]), [3, 1, 4]),
+            (self.mov.num_slice((2, 12, 3)), [2, 5, 8, 11]),
+            (self.mov.select(np.arange(10, 20)).num_slice(2), [12]),
+        ]
+        for view, expected in views:
+            self.assertTrue(np.shares_memory(view.array, self.mov.array))
+            self.assertTrue((view.data == self.mov.data[expected]).all())
+
+    def test_kernels_on_views(self):
+        view = self.mov.sample(8).time_slice((2, 12))
+        copy = ollin.MovementData(
+            self.site,
+            self.mov.data[view.indices, 2:12],
+            view.times,
+            home_range=1.0)
+        self.assertEqual(view.times.size, 10)
+
+        self.assertTrue((
+            ollin.Occupancy(view).visits ==
+            ollin.Occupancy(copy).visits).all())
+
+        cam = ollin.CameraConfiguration.make_grid(2, self.site)
+        self.assertTrue((cam.detect(view).grid == cam.detect(copy).grid).all())
+        self.assertIsNone(view._data)
+
+
+class TestMovementExtend(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=5, days=2, velocity=0.5,
+            movement_model='constant_brownian')
+
+    def test_extend(self):
+        original = self.mov.data.copy()
+        steps_per_day = self.mov.movement_model.parameters['steps_per_day']
+
+        for _ in range(5):
+            self.mov.extend(1)
+
+        steps = 7 * steps_per_day
+        self.assertEqual(self.mov.data.shape, (5, steps, 2))
+        self.assertTrue(
+            (self.mov.data[:, :original.shape[1]] == original).all())
+        self.assertTrue(
+            np.allclose(self.mov.times, np.arange(steps) / steps_per_day))
+
+    def test_extend_copies(self):
+        self.mov.extend(1)
+        first = self.mov.extend(1, inplace=False)
+        first_data = first.data.copy()
+        second = self.mov.extend(1, inplace=False)
+
+        self.assertEqual(first.steps, second.steps)
+        self.assertTrue((first.data == first_data).all())
+        self.assertTrue(
+            (second.data[:, :self.mov.steps] == self.mov.data).all())
+        self.assertFalse(
+            (second.data[:, self.mov.steps:] ==
+             first.data[:, self.mov.steps:]).all())
+
+    def test_extend_views(self):
+        self.mov.extend(1)
+        steps = self.mov.steps
+        original = self.mov.data.copy()
+
+        sample = self.mov.sample(4)
+        extended = sample.extend(1, inplace=False)
+        self.assertEqual(extended.num, 4)
+        self.assertTrue(
+            (extended.data[:, :steps] == original[sample.indices]).all())
+
+        selected = self.mov.select([3])
+        extended = selected.extend(1, inplace=False)
+        self.assertEqual(extended.data.shape, (1, extended.steps, 2))
+        self.assertTrue((extended.data[:, :steps] == original[[3]]).all())
+
+        self.assertTrue((self.mov.data == original).all())
+
+
+class TestMovementStorageTypes(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10, seed=1)
+        self.reference = ollin.Movement.simulate(
+            self.site, num=20, days=10, home_range=1.0, seed=2)
+
+    def test_storage_types(self):
+        for dtype, tolerance in [
+                ('float32', 1e-5),
+                ('int32', 0.0005),
+                ('uint16', 0.005)]:
+            mov = ollin.Movement.simulate(
+                self.site, num=20, days=10, home_range=1.0, seed=2,
+                dtype=dtype, quantum=0.01 if dtype == 'uint16' else None)
+
+            self.assertEqual(mov.array.dtype, np.dtype(dtype))
+            self.assertEqual(mov.data.dtype, np.float64)
+            error = np.abs(mov.data - self.reference.data).max()
+            self.assertLessEqual(error, tolerance)
+
+            occupancy = ollin.Occupancy(mov).occupancy
+            self.assertAlmostEqual(
+                occupancy, ollin.Occupancy(self.reference).occupancy,
+                places=2)
+
+            view = mov.sample(5)
+            self.assertTrue((
+                ollin.Occupancy(view).visits ==
+                ollin.Occupancy(ollin.MovementData(
+                    self.site, view.data, view.times, home_range=1.0)).visits
+            ).all())
+
+            view = mov.sample(5)
+            view.extend(1, inplace=False)
+            self.assertIsNone(view._data)
+
+            mov.extend(1)
+            self.assertEqual(mov.array.dtype, np.dtype(dtype))
+            self.assertEqual(mov.data.shape, (20, 44, 2))
+
+    def test_invalid_storage_type(self):
+        with self.assertRaises(ValueError):
+            ollin.Movement.simulate(
+                self.site, num=2, days=1, velocity=1, dtype='int8')
+        with self.assertRaises(ValueError):
+            ollin.Movement.simulate(
+                self.site, num=2, days=1, velocity=1, dtype='uint16',
+                quantum=0.0001)
+
+
+class TestMovementArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'movement.zip')
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=25, days=10, home_range=1.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_archive(self):
+        self.mov.export(
+            self.path, quantum=0.001, chunk_individuals=10, chunk_steps=7)
+
+        with ollin.MovementArchive(self.path) as archive:
+            self.assertEqual((archive.num, archive.steps), (25, 40))
+
+            mov = archive.load()
+            self.assertIsInstance(mov, ollin.Movement)
+            self.assertLessEqual(
+                np.abs(mov.data - self.mov.data).max(), 0.0005 + 1e-9)
+            self.assertTrue((mov.times == self.mov.times).all())
+
+            sliced = archive.num_slice((3, 22, 2)).time_slice((5, 33, 3))
+            partial = archive.select([3, 5, 7, 9, 11, 13, 15, 17, 19, 21])
+            partial = partial.time_slice((5, 33, 3))
+            self.assertTrue((sliced.data == partial.data).all())
+            self.assertTrue(
+                (archive.time_slice((5, 33, 3)).times == sliced.times).all())
+
+    def test_lossless_quantized(self):
+        mov = ollin.Movement.simulate(
+            self.site, num=5, days=3, home_range=1.0,
+            dtype='uint16', quantum=0.01)
+        mov.export(self.path)
+
+        with ollin.MovementArchive(self.path) as archive:
+            self.assertTrue(np.allclose(archive.read(), mov.data))
+
+
+class TestMovementThinning(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+
+    def test_record_every(self):
+        for model in ollin.get_movement_model_list():
+            full = ollin.Movement.simulate(
+                self.site, num=5, days=10, velocity=0.5,
+                movement_model=model, seed=3)
+            thin = ollin.Movement.simulate(
+                self.site, num=5, days=10, velocity=0.5,
+                movement_model=model, seed=3, record_every=3)
+
+            self.assertEqual(thin.steps, 14)
+            self.assertTrue((thin.data == full.data[:, ::3]).all())
+            self.assertTrue((thin.times == full.times[::3]).all())
+
+    def test_stream_and_extend(self):
+        full = ollin.Movement.simulate(
+            self.site, num=5, days=10, velocity=0.5, seed=3)
+        blocks = list(ollin.Movement.simulate_stream(
+            self.site, num=5, days=10, velocity=0.5, seed=3,
+            block_size=7, record_every=4))
+        data = np.concatenate([block.data for block in blocks], axis=1)
+        times = np.concatenate([block.times for block in blocks])
+        self.assertTrue((data == full.data[:, ::4]).all())
+        self.assertTrue((times == full.times[::4]).all())
+
+        thin = ollin.Movement.simulate(
+            self.site, num=5, days=10, velocity=0.5, record_every=4)
+        thin.extend(5)
+        self.assertEqual(thin.steps, 15)
+        self.assertTrue(np.allclose(np.diff(thin.times), 1))
+
+    def test_invalid_record_every(self):
+        for record_every in [0, -2]:
+            with self.assertRaises(ValueError):
+                ollin.Movement.simulate(
+                    self.site, num=5, days=10, velocity=0.5,
+                    record_every=record_every)
+            with self.assertRaises(ValueError):
+                list(ollin.Movement.simulate_stream(
+                    self.site, num=5, days=10, velocity=0.5,
+                    record_every=record_every))
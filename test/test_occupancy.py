@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+from ollin.core.occupancy import _count_visits  # noqa: E402
+
+
+class TestOccupancy(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.mov = ollin.Movement.simulate(
+            self.site, num=20, days=20, velocity=0.5)
+
+    def test_count_visits(self):
+        oc = ollin.Occupancy(self.mov, resolution=0.5)
+        counts = np.zeros(oc.cell_occupancy.shape)
+        _count_visits(self.mov.data, self.site.range, 0.5, counts)
+        self.assertTrue(np.allclose(counts / oc.steps, oc.cell_occupancy))
+
+    def test_sparse_grid(self):
+        oc = ollin.Occupancy(self.mov, resolution=0.5)
+        grid = oc.grid
+        self.assertEqual(grid.shape, (oc.steps, 20, 20))
+        self.assertEqual(grid.sum(), oc.visits.size)
+        self.assertTrue(np.allclose(grid.mean(axis=0), oc.cell_occupancy))
+        self.assertTrue(np.isclose(grid.mean(), oc.occupancy))
+        self.assertTrue((np.diff(oc.visits) > 0).all())
+
+    def test_timeseries(self):
+        oc = ollin.Occupancy(self.mov, resolution=0.5)
+        grid = oc.grid
+        timeseries = oc.timeseries()
+        expected = [grid[:n].mean() for n in range(1, oc.steps + 1)]
+        self.assertTrue(np.allclose(timeseries, expected))
+
+    def test_batch_from_subsamples(self):
+        nums = [1, 5, 20]
+        np.random.seed(0)
+        batch = ollin.Occupancy.batch_from_subsamples(
+            self.mov, nums, 3, resolution=0.5)
+
+        np.random.seed(0)
+        for n, num in enumerate(nums):
+            for k in range(3):
+                selection = np.random.randint(self.mov.num, size=num)
+                oc = ollin.Occupancy(
+                    self.mov.select(selection), resolution=0.5)
+                self.assertTrue(np.isclose(batch[n, k], oc.occupancy))
+
+    def test_simulate(self):
+        oc = ollin.Occupancy.simulate(
+            self.site,
+            num=20,
+            days=20,
+            velocity=0.5,
+            resolution=0.5,
+            block_size=7)
+        self.assertIsNone(oc.movement)
+        self.assertIsNone(oc.grid)
+        self.assertEqual(oc.timeseries().size, 80)
+        self.assertTrue(np.isclose(oc.timeseries()[-1], oc.occupancy))
+        self.assertEqual(oc.steps, 80)
+        self.assertEqual(oc.cell_occupancy.shape, (20, 20))
+        self.assertTrue(0 < oc.occupancy <= 1)
+
+        for block_size in [7, 16]:
+            oc = ollin.Occupancy.simulate(
+                self.site,
+                num=20,
+                days=20,
+                velocity=0.5,
+                resolution=0.5,
+                block_size=block_size,
+                seed=3)
+            expected = ollin.Occupancy(
+                ollin.Movement.simulate(
+                    self.site, num=20, days=20, velocity=0.5, seed=3),
+                resolution=0.5)
+            self.assertTrue(
+                np.allclose(oc.cell_occupancy, expected.cell_occupancy))
+            self.assertTrue(
+                np.allclose(oc.timeseries(), expected.timeseries()))
+            self.assertTrue(np.isclose(oc.occupancy, expected.occupancy))
+
+        oc = ollin.Occupancy.simulate(
+            self.site, num=5, days=0, velocity=1, resolution=0.5)
+        self.assertEqual(oc.steps, 0)
+        self.assertEqual(oc.times.shape, (0,))
+        self.assertEqual(oc.occupied_cells.shape, (0,))
+        self.assertEqual(oc.timeseries().shape, (0,))
+        self.assertEqual(oc.occupancy, 0)
+
+        with self.assertRaises(ValueError):
+            ollin.Occupancy.simulate(self.site, num=20, velocity=0.5)
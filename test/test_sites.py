@@ -39,3 +39,20 @@ class TestSites(unittest.TestCase):
         site = ollin.BaseSite(r, random_niche)
         self.assertTrue((site.range == r).all())
         self.assertTrue(site.range.dtype == np.float)
+
+    def test_fast_niche(self):
+        random_state = np.random.RandomState(0)
+        points = random_state.normal(size=(100, 2)) * 3 + 10
+        range_ = np.array([20.0, 15.0])
+
+        for bandwidth in [0.1, 0.5]:
+            exact = ollin.Site(
+                range_, points, kde_bandwidth=bandwidth, kde_method='exact')
+            fast = ollin.Site(
+                range_, points, kde_bandwidth=bandwidth, kde_method='fast')
+
+            self.assertEqual(exact.niche.shape, fast.niche.shape)
+            self.assertLess(np.abs(exact.niche - fast.niche).max(), 0.01)
+
+        with self.assertRaises(ValueError):
+            ollin.Site(range_, points, kde_method='slow')
@@ -0,0 +1,53 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.site = ollin.Site.make_random(0.5, range=10)
+        self.records = np.array([
+            ('b', 0.5, 2000.0, 3000.0),
+            ('a', 0.0, 1000.0, 1000.0),
+            ('a', 1.0, 3000.0, 1000.0),
+            ('b', 1.5, 4000.0, 3000.0),
+            ('a', 2.0, 3000.0, 3000.0)],
+            dtype=[('individual', 'U1'), ('time', 'f8'),
+                   ('x', 'f8'), ('y', 'f8')])
+
+    def test_interpolation(self):
+        mov = ollin.load_telemetry(
+            self.records, site=self.site, time_step=0.5,
+            scale=0.001, origin=(0, 0))
+
+        self.assertEqual((mov.num, mov.steps), (2, 5))
+        self.assertTrue(np.allclose(mov.times, [0, 0.5, 1, 1.5, 2]))
+        self.assertTrue(np.allclose(mov.data[0, :, 0], [1, 2, 3, 3, 3]))
+        self.assertTrue(np.allclose(mov.data[0, :, 1], [1, 1, 1, 2, 3]))
+        self.assertTrue(np.allclose(mov.data[1, :, 0], [2, 2, 3, 4, 4]))
+
+    def test_csv(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'fixes.csv')
+        try:
+            with open(path, 'w') as csv_file:
+                csv_file.write('x,y,individual,time\n')
+                for name, time, x, y in self.records:
+                    day = np.datetime64('2020-01-01') + np.timedelta64(
+                        int(time * 24), 'h')
+                    csv_file.write('{},{},{},{}\n'.format(x, y, name, day))
+
+            mov = ollin.load_telemetry(path, scale=0.001, chunk_size=2)
+        finally:
+            shutil.rmtree(directory)
+
+        expected = ollin.load_telemetry(self.records, scale=0.001)
+        self.assertTrue(np.allclose(mov.data, expected.data))
+        self.assertTrue(np.allclose(mov.times, expected.times))
+        self.assertTrue((mov.data <= mov.site.range).all())
@@ -0,0 +1,39 @@
+import fnmatch
+import os
+import unittest
+
+import numba
+
+import sys
+sys.path.append('../')
+import ollin  # noqa: E402
+
+
+def find_cache_index(module, qualname):
+    """Return paths of numba cache index files of a kernel."""
+    pattern = '{}.{}-*.nbi'.format(module.__name__.split('.')[-1], qualname)
+    directories = [
+        os.path.join(os.path.dirname(module.__file__), '__pycache__')]
+    if numba.config.CACHE_DIR:
+        directories.append(numba.config.CACHE_DIR)
+
+    paths = []
+    for directory in directories:
+        for root, _, files in os.walk(directory):
+            paths.extend(
+                os.path.join(root, name)
+                for name in fnmatch.filter(files, pattern))
+    return paths
+
+
+class TestWarmup(unittest.TestCase):
+    def test_warmup(self):
+        modules = ollin.warmup()
+        for model in ollin.get_movement_model_list():
+            module_name = 'ollin.movement_models.{}'.format(model)
+            self.assertIn(module_name, modules)
+
+            kernel = ollin.get_movement_model(model)._movement
+            self.assertTrue(kernel.signatures)
+            self.assertTrue(find_cache_index(
+                sys.modules[module_name], 'Model._movement'))